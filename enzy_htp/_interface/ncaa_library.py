@@ -90,8 +90,7 @@ def search_ncaa_parm_file(target_res: NonCanonicalBase, target_method: str,
             # prepin
             if fs.get_file_ext(parm_file) in [".prepin", ".prepi"]:
                 # 2.1 find 3-letter name in file
-                parm_stru = PrepinParser().get_structure(parm_file)
-                res_name = parm_stru.residues[0].name
+                res_name = PrepinParser().get_residue_name(parm_file)
                 if res_name in [None, "UNK"]:
                     # 2.2 find 3-letter name in filename
                     res_name = _get_res_name_from_filename(parm_file)
@@ -145,15 +145,13 @@ class DoubleLinkedNode():
                 memo[id(self.parent)] = None
             # parent in memo -> this is part of the recursive copying initiated from the parent: default
 
-        # mask current method to use original deepcopy
-        self.__deepcopy__ = None
-
-        new_self = copy.deepcopy(self, memo)
-
-        # recover current method for future use
-        # test shows this will rebind the method to correct instance when its called again
-        delattr(self, "__deepcopy__")
-        delattr(new_self, "__deepcopy__")
+        # copy the instance state the same way as the default deepcopy (copy._reconstruct)
+        # does for plain objects. (instead of masking this method on the instance and
+        # re-entering copy.deepcopy, which added and removed an attribute on every node)
+        cls = self.__class__
+        new_self = cls.__new__(cls)
+        memo[id(self)] = new_self
+        new_self.__dict__.update(copy.deepcopy(self.__dict__, memo))
 
         return new_self
 
@@ -5,6 +5,7 @@ Author: QZ Shao, <shaoqz@icloud.com>
 Date: 2024-01-23
 """
 from typing import Any, Tuple, List
+from itertools import chain
 import re
 
 from .logger import _LOGGER
@@ -59,6 +60,33 @@ def parse_data(fmt: str, data: str, reduce: bool = False) -> List[List]:
 
     return result
 
+def parse_flat_data(fmt: str, data: str) -> List:
+    """helper function that parses a data section from a Fortran-based data file into
+    a flat list of data elements. (i.e.: the chained result of parse_data())
+    When the format only contain one type of element (e.g.: "FORMAT(10I8)"), which is
+    the case for most of the sections in a prmtop file, the data is sliced to
+    elements directly without going through each data point.
+
+    Args:
+        fmt:
+            the FORMAT() string. (e.g.: "FORMAT(10I8)")
+        data:
+            the data content.
+
+    Returns:
+        a list of data elements. (None for the blank ones)
+    """
+    format_list = parse_format(fmt)
+    if len(format_list) != 1:
+        return list(chain.from_iterable(parse_data(fmt, data, reduce=False)))
+
+    type_ctor, width = format_list[0][1], format_list[0][2]
+    result = []
+    for idx in range(0, len(data) - width + 1, width):
+        raw_data_ele = data[idx:idx + width].strip()
+        result.append(type_ctor(raw_data_ele) if raw_data_ele else None)
+    return result
+
 def parse_format(fmt: str) -> List[Tuple[Any, int]]:
     """helper function that parses a FORMAT() notation from a Fortran-based data file.
     (e.g.: the prmtop file from Amber MD)
@@ -22,13 +22,17 @@ Dict related:
         get_copy_of_deleted_dict
 
 Misc:
+    Class:
+        ContentDigestCache
     Decorator:
         timer
 
 Author: QZ Shao, <shaoqz@icloud.com>
 Date: 2022-10-21
 """
+from collections import OrderedDict
 import copy
+import hashlib
 from io import StringIO
 import os
 import re
@@ -292,6 +296,39 @@ class CaptureLogging:
         self.log_stream.seek(0)
 
 
+class ContentDigestCache:
+    """a small least-recently-used cache of parsed file content.
+    keyed on a digest of the content itself (plus an optional tag) instead of
+    (path, mtime, size), so a file rewritten in place is always re-parsed even when
+    its size and mtime did not change.
+    Args:
+        maxsize: the max number of parsed results held"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, content: bytes, parser: Callable[[], Any], tag: Any = None) -> Any:
+        """return the cached result for {content} (and {tag}) or cache and return parser()"""
+        key = (tag, hashlib.blake2b(content, digest_size=16).digest())
+        if key in self._data:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+        self.misses += 1
+        result = parser()
+        self._data[key] = result
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """drop all cached results"""
+        self._data.clear()
+
+
 # == misc ===
 def timer(fn):
     """decodator for timing the run of the function {fn}"""
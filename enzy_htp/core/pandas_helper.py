@@ -5,6 +5,7 @@ Author: QZ Shao, <shaoqz@icloud.com>
 Date: 2022-10-21
 """
 from typing import List
+import numpy as np
 import pandas as pd
 
 
@@ -23,21 +24,15 @@ def split_df_base_on_column_value(df: pd.DataFrame, column_name: str, split_valu
             return [df.copy()]
         return [df]
 
-    split_values = sorted(split_values)
-    frist = 1
-    result_dfs = []
-    for this_value in split_values:
-        if frist:
-            frist_df = df[df[column_name] < this_value]
-            result_dfs.append(frist_df)
-            frist = 0
-            last_value = this_value
-            continue
-        result_df = df[(df[column_name] < this_value) & (df[column_name] > last_value)]
-        result_dfs.append(result_df)
-        last_value = this_value
-    # deal with the last portion
-    result_dfs.append(df[df[column_name] > split_values[-1]])
+    # one pass: the segment of each row is the number of split values below it
+    split_values = np.sort(np.asarray(split_values))
+    values = df[column_name].to_numpy()
+    seg_ids = np.searchsorted(split_values, values, side="left")
+    on_split = split_values[np.minimum(seg_ids, len(split_values) - 1)] == values
+    rows = np.argsort(seg_ids, kind="stable")
+    rows = rows[~on_split[rows]]
+    seg_bounds = np.searchsorted(seg_ids[rows], np.arange(1, len(split_values) + 1), side="left")
+    result_dfs = [df.iloc[seg_rows] for seg_rows in np.split(rows, seg_bounds)]
 
     if copy:
         for i, df_i in enumerate(result_dfs):
@@ -49,6 +44,17 @@ def split_df_base_on_column_value(df: pd.DataFrame, column_name: str, split_valu
 def batch_edit_df_loc_value(df: pd.DataFrame, loc_value_list: List[tuple], column: str):
     """
     batch edit "column" of "df" with the "loc_value_list"
+    (scalar values of existing locs are assigned in one .loc call; the last value wins for repeating locs.
+    new locs enlarge the df and list-like values are assigned one by one as a per-item .loc would)
     """
-    for loc, value in loc_value_list:
-        df.loc[loc, column] = value
+    loc_value_mapper = dict(loc_value_list)
+    batch_locs = []
+    batch_values = []
+    for loc, value in loc_value_mapper.items():
+        if df.index.is_unique and loc in df.index and pd.api.types.is_scalar(value):
+            batch_locs.append(loc)
+            batch_values.append(value)
+        else:
+            df.loc[loc, column] = value
+    if batch_locs:
+        df.loc[batch_locs, column] = batch_values
@@ -21,6 +21,12 @@ from enzy_htp.mutation_class import (
 from .position_pattern import decode_position_pattern
 from .target_aa_pattern import check_target_aa_pattern, decode_target_aa_pattern
 
+# patterns below are compiled once at import instead of on every decode call
+_MUTANT_SEPARATE_PATTERN = re.compile(r"(?:[^,[{]|(?:\{[^\}]*\})|(?:\[[^\]]*\]))+[^,]*")
+_SECTION_SEPARATE_PATTERN = re.compile(r"(?:[^,[{]|(?:\[[^\]]*\]))+[^,]*")
+_RANDOM_SECTION_PATTERN = re.compile(r"r:([0-9]*)(R?)\[(.+)\]\*([0-9]*)(R?)")
+_ALL_SECTION_PATTERN = re.compile(r"a:(M?)\[(.+)\]")
+
 
 def decode_mutation_pattern(stru: Structure, pattern: str) -> List[List[Mutation]]:
     """
@@ -50,8 +56,7 @@ def decode_mutation_pattern(stru: Structure, pattern: str) -> List[List[Mutation
 
 def seperate_mutant_patterns(pattern: str) -> List[str]:
     """seperate a mutation pattern into pattern of each mutants"""
-    section_seperate_pattern = r"(?:[^,[{]|(?:\{[^\}]*\})|(?:\[[^\]]*\]))+[^,]*" #TODO use the one from general
-    mutants = re.findall(section_seperate_pattern, pattern.strip())
+    mutants = _MUTANT_SEPARATE_PATTERN.findall(pattern.strip())
     mutants = [i.strip() for i in mutants]
 
     return mutants
@@ -62,8 +67,7 @@ def seperate_section_patterns(pattern: str) -> List[str]:
     *Note that current method use re and do not support [] in a []
     (e.g. 1,2,3,a:[4,[5,6],7] does not work)"""
 
-    section_seperate_pattern = r"(?:[^,[{]|(?:\[[^\]]*\]))+[^,]*" #TODO use the one from general
-    sections = re.findall(section_seperate_pattern, pattern.strip())
+    sections = _SECTION_SEPARATE_PATTERN.findall(pattern.strip())
     sections = [i.strip() for i in sections]
 
     return sections
@@ -109,14 +113,14 @@ def decode_random_mutation(stru: Structure, section_pattern: str) -> List[List[M
         (M number of N point mutants)
         (R stands for whether repeating mutation is allowed for each mutant and
         whether repeating mutant is allowed in the result, respectively)"""
-    re_pattern = r"r:([0-9]*)(R?)\[(.+)\]\*([0-9]*)(R?)"
-    mut_point_num, point_allow_repeat, mutation_esm_patterns, mutant_num, mutant_allow_repeat = re.match(re_pattern,
-                                                                                                         section_pattern).groups()
+    mut_point_num, point_allow_repeat, mutation_esm_patterns, mutant_num, mutant_allow_repeat = _RANDOM_SECTION_PATTERN.match(
+        section_pattern).groups()
     mut_point_num = int(mut_point_num)
     mutant_num = int(mutant_num)
     mutation_esm_mapper = decode_mutation_esm_pattern(stru, mutation_esm_patterns)  # {mutation_site: Mutation}
 
-    _LOGGER.info(f"generating random mutants in positions: {list(mutation_esm_mapper.keys())} ({len(mutation_esm_mapper)} sites total)")
+    positions = list(mutation_esm_mapper.keys())  # built once and drawn from by index for every point
+    _LOGGER.info(f"generating random mutants in positions: {positions} ({len(positions)} sites total)")
     if len(mutation_esm_mapper) < mut_point_num:
         raise InvalidMutationPatternSyntax(
             f"number of desired point mutations are more than the total number of possible mutation sites in the ensemble, desired: {mut_point_num}, possible_sites: {len(mutation_esm_mapper)}"
@@ -128,13 +132,13 @@ def decode_random_mutation(stru: Structure, section_pattern: str) -> List[List[M
         each_mutant: Dict[tuple, Mutation] = {}  # point mutation of each mutant
 
         if not point_allow_repeat:
-            non_repeat_points = list(mutation_esm_mapper.keys())
+            non_repeat_points = list(positions)
 
         temp_point_num = mut_point_num  # will only not eq to mut_point_num when repeat is allowed
         while len(each_mutant) < temp_point_num:
             # 1. determine positionn
             if point_allow_repeat:
-                new_position = get_random_list_elem(list(mutation_esm_mapper.keys()))
+                new_position = get_random_list_elem(positions)
                 if new_position in each_mutant:
                     _LOGGER.warning(
                         f"repeating mutation is generated for {new_position}, the later one is used, also less num of mutations in this mutant (point_allow_repeat: True)"
@@ -178,8 +182,7 @@ def decode_all_mutation(stru: Structure, section_pattern: str) -> List[List[Muta
     pattern_example:
         a:[xxx:yyy] or a:M[xxx:yyy]"""
     result: List[List[Mutation]] = []
-    re_pattern = r"a:(M?)\[(.+)\]"
-    force_mutate_each_point, mutation_esm_patterns = re.match(re_pattern, section_pattern).groups()
+    force_mutate_each_point, mutation_esm_patterns = _ALL_SECTION_PATTERN.match(section_pattern).groups()
     mutation_esm_mapper = decode_mutation_esm_pattern(stru, mutation_esm_patterns)  #{position: mutations}
     if force_mutate_each_point:
         result = list(itertools.product(*mutation_esm_mapper.values()))
@@ -19,6 +19,9 @@ from enzy_htp.core.logger import _LOGGER
 import enzy_htp.chemical as chem
 import enzy_htp.structure as es
 
+_MUTATION_FLAG_PATTERN = re.compile(r"([A-Z])([A-Z])?([0-9]+)([A-Z])")
+"""the XA##Y pattern of generate_from_mutation_flag(). compiled once at import"""
+
 
 class Mutation:
     """representing a single point mutation in an enzyme.
@@ -80,13 +83,14 @@ class Mutation:
         # Mutation.chain_id, Mutation.res_idx: should exist in {stru}, should not be empty
         if self.chain_id.strip() == "":
             raise InvalidMutation(f"empty chain_id in: {self}")
-        if self.chain_id not in stru.chain_mapper:
-            raise InvalidMutation(f"chain id in {self} does not exist in structure (in-stru: {stru.chain_mapper.keys()})")
-        if self.res_idx not in stru[self.chain_id].residue_idxs:
-            raise InvalidMutation(f"res_idx in {self} does not exist in structure (in-stru: {stru[self.chain_id].residue_idx_interval()})")
+        chain = stru.get_chain(self.chain_id)
+        if chain is None:
+            raise InvalidMutation(f"chain id in {self} does not exist in structure (in-stru: {stru.chain_names})")
+        if self.res_idx not in chain.residue_idx_set:
+            raise InvalidMutation(f"res_idx in {self} does not exist in structure (in-stru: {chain.residue_idx_interval()})")
 
         # Mutation.orig: if match the original residue in the {stru}
-        real_orig = convert_to_canonical_three_letter(stru[self.chain_id].find_residue_idx(self.res_idx).name)
+        real_orig = convert_to_canonical_three_letter(chain.find_residue_idx(self.res_idx).name)
         if real_orig != self.orig:
             raise InvalidMutation(f"original residue does not match in: {self} (real_orig: {real_orig})")
 
@@ -173,10 +177,9 @@ def generate_from_mutation_flag(mutation_flag: str) -> Mutation:
     mutation_flag = mutation_flag.strip()
     if mutation_flag == "WT":
         return Mutation(None, "WT", None, None)
-    pattern = r"([A-Z])([A-Z])?([0-9]+)([A-Z])"
-    flag_match = re.match(pattern, mutation_flag)
+    flag_match = _MUTATION_FLAG_PATTERN.match(mutation_flag)
     if flag_match is None:
-        raise InvalidMutationFlagSyntax(f"{mutation_flag} doesnt match ([A-Z])([A-Z])?([0-9]+)([A-Z])")
+        raise InvalidMutationFlagSyntax(f"{mutation_flag} doesnt match {_MUTATION_FLAG_PATTERN.pattern}")
 
     orig = convert_to_three_letter(flag_match.group(1))
     chain_id = flag_match.group(2)
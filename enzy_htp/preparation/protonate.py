@@ -30,7 +30,6 @@ from enzy_htp.structure.structure_enchantment import init_connectivity
 from pdb2pqr.main import main_driver as run_pdb2pqr
 from pdb2pqr.main import build_main_parser as build_pdb2pqr_parser
 import openbabel.pybel as pybel
-from .pdb_line import read_pdb_lines
 
 
 def protonate_stru(stru: Structure,
@@ -326,7 +325,7 @@ def _fix_pybel_output(pdb_path: str, out_path: str, ref_name_path: str = None) -
         ref_atom_names = []
         ref_ligand = PandasPdb()
         ref_ligand.read_pdb(ref_name_path)
-        ref_ligand_df: pd.DataFrame = pd.concat((ref_ligand.df["ATOM"], ref_ligand.df["HETATM"]), ignore_index=True)
+        ref_ligand_df: pd.DataFrame = PDBParser._get_atom_site_df(ref_ligand.df["ATOM"], ref_ligand.df["HETATM"])
         ref_ligand_df.sort_values("line_idx", inplace=True)  # make sure lines are aligned
 
         # (Zhong) Find the first hydrogen atom in the element column
@@ -354,7 +353,7 @@ def _fix_pybel_output(pdb_path: str, out_path: str, ref_name_path: str = None) -
 
     target_ligand = PandasPdb()
     target_ligand.read_pdb(pdb_path)
-    target_ligand_df: pd.DataFrame = pd.concat((target_ligand.df["ATOM"], target_ligand.df["HETATM"]), ignore_index=True)
+    target_ligand_df: pd.DataFrame = PDBParser._get_atom_site_df(target_ligand.df["ATOM"], target_ligand.df["HETATM"])
     target_ligand_df.sort_values("line_idx", inplace=True)  # make sure lines are aligned
     atom_names = list(target_ligand_df["atom_name"])
     if ref_name_path is not None:
@@ -373,19 +372,19 @@ LIGAND_PROTONATION_METHODS = {"pybel": protonate_ligand_with_pybel}
 
 # below TODO
 def _ob_pdb_charge(pdb_path: str) -> int:
-    # TODO(CJ): add tests for this function
     """
     extract net charge from openbabel exported pdb file
     """
-    pdb_ls = read_pdb_lines(pdb_path)
+    if not fs.has_content(pdb_path):
+        return 0
+    pdb_df = pd.read_fwf(pdb_path, colspecs=[(0, 6), (12, 16), (78, 80)], names=["record_name", "atom_name", "raw"],
+                         header=None, dtype=str, keep_default_na=False)
+    charged_df = pdb_df[pdb_df["record_name"].isin(("ATOM", "HETATM")) & (pdb_df["raw"] != "")]
+    # formal charges are written as e.g. "1+" or "2-" in the PDB charge column
+    magnitudes = charged_df["raw"].str.strip("+-").astype(int)
+    charges = magnitudes.where(~charged_df["raw"].str.contains("-"), -magnitudes)
     net_charge = 0
-    for pdb_l in pdb_ls:
-        if pdb_l.is_HETATM() or pdb_l.is_ATOM():
-            raw: str = pdb_l.get_charge()
-            raw = raw.strip()
-            if not len(raw):
-                continue
-            charge = pdb_l.charge[::-1]
-            core._LOGGER.info(f"Found formal charge: {pdb_l.atom_name} {charge}")  # TODO make this more intuitive/make sense
-            net_charge += int(charge)
+    for atom_name, charge in zip(charged_df["atom_name"], charges):
+        core._LOGGER.info(f"Found formal charge: {atom_name} {charge:+d}")  # TODO make this more intuitive/make sense
+        net_charge += int(charge)
     return net_charge
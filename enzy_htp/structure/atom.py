@@ -105,6 +105,37 @@ class Atom(DoubleLinkedNode):
             atom_type = _atom_type,
         )
 
+    @classmethod
+    def from_biopandas_df(cls, df: pd.DataFrame) -> List[Atom]:
+        """Constructor of a list of Atom(), one for each row of df. Same as from_biopandas() applied
+        on each row but the fields are prepared column-wise instead of looking up the row keys and
+        checking NaN for every atom."""
+        n_rows = len(df)
+
+        def optional_column(col_name: str) -> List:
+            """values of a column as python objects. None where missing"""
+            if col_name not in df:
+                return [None] * n_rows
+            col = df[col_name]
+            if col.dtype == object:
+                return col.where(col.str.strip() != "", None).tolist()
+            return col.astype(object).where(col.notna(), None).tolist()
+
+        # names and elements repeat heavily across atoms. intern them so equal values share one object
+        names = [sys.intern(name) for name in df["atom_name"].str.strip().tolist()]
+        coords = zip(df["x_coord"].tolist(), df["y_coord"].tolist(), df["z_coord"].tolist())
+        idxs = optional_column("atom_number")
+        b_factors = optional_column("b_factor")
+        elements = [None if ele is None else sys.intern(ele.strip()) for ele in optional_column("element_symbol")]
+        charges = [None if charge is None else float(charge) for charge in optional_column("charge")]
+        atom_types = optional_column("atom_type")
+
+        return [
+            cls(name=name, coord=coord, idx=idx, b_factor=b_factor, element=element, charge=charge, atom_type=atom_type)
+            for name, coord, idx, b_factor, element, charge, atom_type
+            in zip(names, coords, idxs, b_factors, elements, charges, atom_types)
+        ]
+
     #region === Getter-Attr (ref) ===
     @property
     def name(self) -> str:
@@ -8,7 +8,9 @@ from __future__ import annotations
 from copy import deepcopy
 import math
 import sys
-from typing import Iterable, List, Tuple, Union
+from typing import Iterable, List, Set, Tuple, Union
+
+import numpy as np
 
 from enzy_htp.core import _LOGGER
 from enzy_htp.core.doubly_linked_tree import DoubleLinkedNode
@@ -117,10 +119,7 @@ class Chain(DoubleLinkedNode):
     @property
     def num_atoms(self) -> int:
         """Finds the total number of Atom() objects contained in the Residue() children objects."""
-        total = 0
-        for res in self._residues:
-            total += res.num_atoms
-        return total
+        return sum(res.num_atoms for res in self._residues)
 
     @property
     def num_residues(self) -> int:
@@ -132,6 +131,11 @@ class Chain(DoubleLinkedNode):
         """return a list of indexes of containing residues"""
         return list(map(lambda x: x.idx, self._residues))
 
+    @property
+    def residue_idx_set(self) -> Set[int]:
+        """return a set of indexes of containing residues for O(1) membership checks"""
+        return {res.idx for res in self._residues}
+
     @property
     def largest_res_idx(self) -> int:
         """return the largest residue index in the chain"""
@@ -189,20 +193,20 @@ class Chain(DoubleLinkedNode):
         """
         if there is any non-aminoacid part in chain
         """
-        return not sum(list(map(lambda rr: (not rr.is_canonical()) and (not rr.is_modified()), self._residues)))
+        return all(rr.is_canonical() or rr.is_modified() for rr in self._residues)
 
     def has_metal(self) -> bool:
         """Checks if any metals are contained within the current chain."""
-        return sum(list(map(lambda rr: rr.is_metal(), self._residues)))
+        return any(rr.is_metal() for rr in self._residues)
 
     def has_ligand(self) -> bool:
-        return sum(list(map(lambda rr: rr.is_ligand(), self._residues)))
+        return any(rr.is_ligand() for rr in self._residues)
 
     def has_solvent(self) -> bool:
-        return sum(list(map(lambda rr: rr.is_solvent(), self._residues)))
+        return any(rr.is_solvent() for rr in self._residues)
 
     def has_trash(self) -> bool:
-        return sum(list(map(lambda rr: rr.is_trash(), self._residues)))
+        return any(rr.is_trash() for rr in self._residues)
 
     def is_empty(self) -> bool:
         """Does the chain have any Residue()"s."""
@@ -233,14 +237,12 @@ class Chain(DoubleLinkedNode):
         """
         self_atoms = self.atoms
         self_atoms.sort(key=lambda a: a.idx)
-        self_coord = map(lambda x: x.coord, self_atoms)
         other_atoms = other.atoms
         other_atoms.sort(key=lambda a: a.idx)
-        other_coord = map(lambda x: x.coord, other_atoms)
-        for s, o in zip(self_coord, other_coord):
-            if abs(s[0] - o[0]) > tol or abs(s[1] - o[1]) > tol or abs(s[2] - o[2]) > tol:
-                return False
-        return True
+        num_compare = min(len(self_atoms), len(other_atoms))
+        self_coord = np.array([a.coord for a in self_atoms[:num_compare]], dtype=float).reshape(-1, 3)
+        other_coord = np.array([a.coord for a in other_atoms[:num_compare]], dtype=float).reshape(-1, 3)
+        return bool(np.all(np.abs(self_coord - other_coord) <= tol))
 
     def is_connected(self) -> bool:
         """check whether all atoms within the chain have connected initiated"""
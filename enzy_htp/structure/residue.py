@@ -169,6 +169,11 @@ class Residue(DoubleLinkedNode):
         """get a list of atom names in the residue"""
         return list(map(lambda a: a.name, self.atoms))
 
+    @property
+    def atom_name_set(self) -> frozenset:
+        """get a hashable set of atom names in the residue (order-free topology signature)"""
+        return frozenset(a.name for a in self.atoms)
+
     @property
     def atom_idx_list(self) -> List[int]:
         """get a list of atom indexes in the residue"""
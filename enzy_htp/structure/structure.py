@@ -84,6 +84,7 @@ Date: 2022-04-03
 #TODO(CJ): add a method for changing/accessing a specific residue
 from __future__ import annotations
 import itertools
+import logging
 import os
 from plum import dispatch
 import string
@@ -91,6 +92,7 @@ from copy import deepcopy
 import sys
 from typing import List, Set, Dict, Tuple, Union
 from collections import defaultdict
+import numpy as np
 
 import enzy_htp.core.math_helper as mh
 from enzy_htp.core import _LOGGER
@@ -136,6 +138,10 @@ class Structure(DoubleLinkedNode):
     REFERENCE_CHAIN_ORDER = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J',
                              'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T',
                              'U', 'V', 'W', 'X', 'Y', 'Z',] + [str(x) for x in range(50000)]
+    _REFERENCE_CHAIN_RANK = dict(zip(REFERENCE_CHAIN_ORDER, itertools.count()))
+    """chain name -> position in REFERENCE_CHAIN_ORDER (O(1) sort key)"""
+    _NEW_CHAIN_NAME_CANDIDATES = tuple(string.ascii_uppercase) + tuple(map(str, range(500)))
+    """candidates for _legal_new_chain_names() in order of preference"""
 
     def __init__(self, chains: List[Chain]):
         """Constructor that takes just a list of Chain() objects as input."""
@@ -200,9 +206,8 @@ class Structure(DoubleLinkedNode):
         Return:
             the legal chain name list
         """
-        result = list(string.ascii_uppercase) + list(map(str, range(500)))
-        result = list(filter(lambda s: s not in self.chain_names, result))
-        return result
+        taken_names = set(self.chain_names)
+        return [name for name in self._NEW_CHAIN_NAME_CANDIDATES if name not in taken_names]
 
     @property
     def num_residues(self) -> int:
@@ -274,8 +279,8 @@ class Structure(DoubleLinkedNode):
 
     @property
     def num_atoms(self) -> int:
-        """number of Atom()s"""
-        return len(self.atoms)
+        """number of Atom()s. counted per chain without building the .atoms list"""
+        return sum(ch.num_atoms for ch in self._chains)
 
     @property
     def atom_idx_list(self) -> List[int]:
@@ -284,11 +289,14 @@ class Structure(DoubleLinkedNode):
 
     def find_atoms_in_range(self, center: Union[Atom, Tuple[float, float, float]], range_distance: float) -> List[Atom]:
         """find atoms in {range} of {center}. return a list of atoms found"""
-        result = []
-        for atom in self.atoms:
-            if atom.distance_to(center) <= range_distance:
-                result.append(atom)
-        return result
+        if isinstance(center, Atom):
+            center = center.coord
+        atoms = self.atoms
+        if not atoms:
+            return []
+        coords = np.array([atom.coord for atom in atoms], dtype=float)
+        in_range = np.linalg.norm(coords - np.array(center, dtype=float), axis=1) <= range_distance
+        return [atom for atom, if_in_range in zip(atoms, in_range) if if_in_range]
 
     def find_idx_atom(self, atom_idx: int) -> Atom:
         """find atom base on its idx. return a reference of the atom.
@@ -609,13 +617,13 @@ class Structure(DoubleLinkedNode):
     def has_duplicate_chain_name(self) -> bool:
         """check if self._chain have duplicated chain name
         give warning if do."""
-        existing_c_id = []
+        existing_c_id = set()
         ch: Chain
         for ch in self._chains:
             if ch.name in existing_c_id:
                 _LOGGER.warning(f"Duplicate chain names detected in Structure obj during {sys._getframe().f_back.f_code.co_name}()! ")
                 return True
-            existing_c_id.append(ch.name)
+            existing_c_id.add(ch.name)
         return False
 
     def is_idx_subset(self, target_stru: Structure) -> bool:
@@ -630,14 +638,15 @@ class Structure(DoubleLinkedNode):
         Returns:
             Boolean reflect if the target structure is a index subset of self
         """
+        self_chain_mapper = self.chain_mapper
         trgt_ch: Chain
         for trgt_ch in target_stru:
-            if trgt_ch.name not in self.chain_mapper:
-                _LOGGER.info(f"current stru {list(self.chain_mapper.keys())} doesnt contain chain: {trgt_ch} from the target stru")
+            if trgt_ch.name not in self_chain_mapper:
+                _LOGGER.info(f"current stru {list(self_chain_mapper.keys())} doesnt contain chain: {trgt_ch} from the target stru")
                 return False
 
-            self_ch = self.chain_mapper[trgt_ch.name]
-            self_ch_resi_idxes = self_ch.residue_idxs
+            self_ch = self_chain_mapper[trgt_ch.name]
+            self_ch_resi_idxes = self_ch.residue_idx_set
             res: Residue
             for res in trgt_ch:
                 if res.idx not in self_ch_resi_idxes:
@@ -701,14 +710,14 @@ class Structure(DoubleLinkedNode):
         NOTE that indexing is redundant but we will have another method
         to do indexing free mapping/checking."""
         # same sequences TODO make it more general
-        if self.residue_namedkey_mapper.keys() == other.residue_namedkey_mapper.keys():
-            for self_res, other_res in zip(self.residues, other.residues):
-                self_atom_names = set(self_res.atom_name_list)
-                other_atom_names = set(other_res.atom_name_list)
-                if not self_atom_names == other_atom_names:
-                    return False
-            return True
-        return False
+        self_residues = self.residues
+        other_residues = other.residues
+        if len(self_residues) != len(other_residues):
+            return False
+        if [res.key(if_name=True) for res in self_residues] != [res.key(if_name=True) for res in other_residues]:
+            return False
+        return all(self_res.atom_name_set == other_res.atom_name_set
+                   for self_res, other_res in zip(self_residues, other_residues))
 
     def is_same_topology_atomic(self, other: Structure) -> bool:
         """check whether self and other have the same topology.
@@ -749,7 +758,7 @@ class Structure(DoubleLinkedNode):
         sort children chains with their chain name
         sorted is always better than not but Structure() is being lazy here
         """
-        self._chains.sort(key=lambda x: self.REFERENCE_CHAIN_ORDER.index(x.name))
+        self._chains.sort(key=lambda x: self._REFERENCE_CHAIN_RANK[x.name])
 
     def sort_everything(self) -> None:
         """sort all object in structure"""
@@ -766,12 +775,15 @@ class Structure(DoubleLinkedNode):
         if sort_first:
             self.sort_everything()
         _LOGGER.info("renumbering atoms")
-        a_id = 1
-        for atom in self.atoms:
-            if atom.idx != a_id:
-                _LOGGER.debug(f"changing atom {atom.idx} -> {a_id}")
-            atom.idx = a_id
-            a_id += 1
+        if_debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        changed_count = 0
+        for a_id, atom in enumerate(self.atoms, start=1):
+            if atom._idx != a_id:
+                changed_count += 1
+                if if_debug:
+                    _LOGGER.debug(f"changing atom {atom._idx} -> {a_id}")
+                atom._idx = a_id
+        _LOGGER.debug(f"renumbered {changed_count} atoms")
 
     def resolve_duplicated_chain_name(self) -> None:
         """resolve for duplicated chain name in self.chains_
@@ -877,12 +889,17 @@ class Structure(DoubleLinkedNode):
         Returns:
             The specified index of the target residue, if present. 
         """
-        for ridx, res in enumerate(self.residues):
-            if res == target:
-                return ridx + indexed
-        else:
-            _LOGGER.error(f"The supplied target residue {target} is not part of this Structure. You may have copied your Structure at some point! Exiting...")
-            exit( 1 )
+        offset = 0
+        target_chain = target.parent
+        for ch in self._chains:
+            if ch is target_chain:
+                for ridx, res in enumerate(ch.residues):
+                    if res is target:
+                        return offset + ridx + indexed
+                break
+            offset += len(ch)
+        _LOGGER.error(f"The supplied target residue {target} is not part of this Structure. You may have copied your Structure at some point! Exiting...")
+        exit( 1 )
 
     def assign_ncaa_chargespin(self, net_charge_mapper: Dict[str, Tuple[int, int]]):
         """assign net charges to NCAAs in Structure() based on net_charge_mapper
@@ -939,7 +956,7 @@ class Structure(DoubleLinkedNode):
             f"<Structure object at {hex(id(self))}>",
         ]
         out_line.append("Structure(")
-        out_line.append(f"chains: (sorted, original {list(self.chain_mapper.keys())})")
+        out_line.append(f"chains: (sorted, original {self.chain_names})")
         for ch in sorted(self._chains, key=lambda x: x.name):
             ch: Chain
             out_line.append(f"    {ch.name}({ch.chain_type}): residue: {ch.residue_idx_interval()} atom_count: {ch.num_atoms}")
@@ -959,8 +976,10 @@ class Structure(DoubleLinkedNode):
         """support dictionary like delete"""
         if isinstance(key, int):
             super().__delitem__(key)
+            return
         if isinstance(key, str):
             self.chain_mapper[key].delete_from_parent()
+            return
         raise KeyError("Structure() delitem only take int or str as key")
 
     def __bool__(self) -> bool:
@@ -47,7 +47,7 @@ class StructureEnsemble:
     def structures(self, remove_solvent: bool=False) -> Generator[Structure]:
         """get a Generator of all geometries in the ensemble
         as Structure()s"""
-        stru = deepcopy(self.topology)
+        stru = self._owned_topology() if remove_solvent else self.topology
         if remove_solvent:
             stru_oper.remove_solvent(stru)
             stru_oper.remove_counterions(stru)
@@ -57,9 +57,6 @@ class StructureEnsemble:
                 remove_solvent=remove_solvent
             ):
             result = deepcopy(stru)
-            if remove_solvent:
-                stru_oper.remove_solvent(result)
-                stru_oper.remove_counterions(result)
             result.apply_geom(this_coord)
             yield result
 
@@ -75,10 +72,18 @@ class StructureEnsemble:
     def structure_0(self) -> Structure:
         """getter for the 1st structure in the ensemble"""
         coord_0 = next(self.coord_parser(self.coordinate_list))
-        result = deepcopy(self.topology)
+        result = self._owned_topology()
         result.apply_geom(coord_0)
         return result    
 
+    def _owned_topology(self) -> Structure:
+        """get a topology Structure() that is safe to modify. Only copy when
+        self holds the Structure() object. (a freshly parsed one is already owned)"""
+        result = self.topology
+        if result is self._topology:
+            result = deepcopy(result)
+        return result
+
     @classmethod
     def from_single_stru(cls, stru: Structure) -> StructureEnsemble:
         """create an ensemble of 1 snapshot from a stru"""
@@ -10,15 +10,17 @@ import copy
 import os
 import string
 import sys
-from typing import Dict, List, Tuple, Union
+from typing import Dict, Iterator, List, Tuple, Union
 from plum import dispatch
 from biopandas.pdb import PandasPdb
+from biopandas.pdb.engines import pdb_records
+import numpy as np
 import pandas as pd
 
 from enzy_htp.core import _LOGGER
 from enzy_htp.core.exception import IndexMappingError
 import enzy_htp.core.file_system as fs
-from enzy_htp.core.general import if_list_contain_repeating_element, list_remove_adjacent_duplicates
+from enzy_htp.core.general import ContentDigestCache, if_list_contain_repeating_element, list_remove_adjacent_duplicates
 from enzy_htp.core.pandas_helper import batch_edit_df_loc_value, split_df_base_on_column_value
 import enzy_htp.chemical as chem
 from ._interface import StructureParserInterface
@@ -31,6 +33,11 @@ from ..modified_residue import ModifiedResidue, residue_to_modified_residue
 from ..chain import Chain
 from ..structure import Structure
 
+_PDB_LINE_WIDTH = 80
+"""width of the fixed-width part of PDB ATOM/HETATM/ANISOU records"""
+_PDB_CHAIN_ID_CANDIDATES = tuple(string.ascii_uppercase) + tuple(map(str, range(50000)))
+"""candidates for new chain ids in order of preference (see PDBParser._get_legal_pdb_chain_ids)"""
+
 
 class PDBParser(StructureParserInterface):
     """
@@ -43,6 +50,9 @@ class PDBParser(StructureParserInterface):
         """
         pass
 
+    _pdb_df_cache = ContentDigestCache(maxsize=4)
+    """parsed dataframes of the last few PDB files read by _read_pdb_df()"""
+
     # knowledge
     PDB_NONSTRU_INFO_LINE_NAME = [
         "HEADER", "TITLE", "COMPND", "SOURCE", "KEYWDS", "EXPDTA", "NUMMDL", "AUTHOR", "REVDAT", "SPRSDE", "JRNL", "REMARK", "DBREF",
@@ -95,14 +105,16 @@ class PDBParser(StructureParserInterface):
             Structure()
         """
         _LOGGER.debug(f"working on {path}")
-        cls._check_valid_pdb(path)
-        # covert to dataframe with biopanda (maybe write our own in the future)
-        input_pdb = PandasPdb()
-        input_pdb.read_pdb(path)
+        cls._check_valid_pdb(path, check_encoding=False)
+        # covert to dataframe (biopandas compatible). the encoding is checked while reading
+        # only the records used below are copied out of the cache. (OTHERS is only used for locating models and TERs)
+        input_pdb_df = cls._read_pdb_df(path,
+                                        records=("ATOM", "HETATM", "OTHERS"),
+                                        other_record_names=("TER", "MODEL", "ENDMDL"))
 
         #region (PDB conundrums)
         # deal with multiple model
-        target_model_df, target_model_ter_df = cls._get_target_model(input_pdb.df, model=model)
+        target_model_df, target_model_ter_df = cls._get_target_model(input_pdb_df, model=model)
 
         # TODO address when atom/residue/chain id is disordered respect to the line index
         # this is important to be aligned since Amber will force them to align and erase the chain id
@@ -214,8 +226,10 @@ class PDBParser(StructureParserInterface):
 
     #region == pdb -> Stru ==
     @staticmethod
-    def _check_valid_pdb(pdb_path: str) -> None:
+    def _check_valid_pdb(pdb_path: str, check_encoding: bool = True) -> None:
         """Helper function that ensures the supplied pdb_path contain a valid pdb file.
+        check_encoding=False skips the ASCII check for callers that check the encoding
+        on the bytes they parse anyway (see _parse_pdb_df).
         Private to structure.structure_io.pdb_io.py. Should NOT be called externally."""
         # check for right extension
         ext: str = fs.get_file_ext(pdb_path)
@@ -226,12 +240,92 @@ class PDBParser(StructureParserInterface):
         if not os.path.exists(pdb_path):
             _LOGGER.error(f"Supplied file '{pdb_path}' does NOT exist. Exiting...")
             sys.exit(1)
-        # check for character encoding
-        for idx, ll in enumerate(fs.lines_from_file(pdb_path)):
+        # check for character encoding (whole buffer at once, locate the line only on failure)
+        if not check_encoding:
+            return
+        with open(pdb_path, "rb") as f:
+            pdb_bytes = f.read()
+        if pdb_bytes.isascii():
+            return
+        for idx, ll in enumerate(pdb_bytes.splitlines()):
             if not ll.isascii():
+                ll = ll.decode(errors="replace")
                 _LOGGER.error(f"The PDB '{pdb_path}' contains non-ASCII text and is invalid in line {idx}: '{ll}'. Exiting...")
                 sys.exit(1)
 
+    @classmethod
+    def _read_pdb_df(cls,
+                     pdb_path: str,
+                     records: Tuple[str] = None,
+                     other_record_names: Tuple[str] = None) -> Dict[str, pd.DataFrame]:
+        """Read a PDB file into the same {"ATOM", "HETATM", "ANISOU", "OTHERS"} dataframes as
+        PandasPdb().read_pdb(pdb_path).df (same columns, dtypes and line_idx).
+        Parsed results of the last few files are cached on a digest of the file content so
+        re-reading unchanged content only costs a read and a hash. A copy of the cached
+        dataframes is returned each time.
+        Exits when the file contains non-ASCII text (same as _check_valid_pdb).
+        Args:
+            records: only return (and copy) these dataframes. (default: all)
+            other_record_names: only keep OTHERS rows of these record names. (e.g.: ("TER", "MODEL", "ENDMDL"))
+                (default: all)"""
+        with open(pdb_path, "rb") as f:
+            pdb_bytes = f.read()
+        cached_df = cls._pdb_df_cache.get(pdb_bytes, lambda: cls._parse_pdb_df(pdb_path, pdb_bytes))
+        if records is None:
+            records = cached_df.keys()
+        result = {}
+        for record in records:
+            record_df = cached_df[record]
+            if record == "OTHERS" and other_record_names is not None:
+                record_df = record_df[record_df["record_name"].isin(other_record_names)]
+            result[record] = record_df.copy()
+        return result
+
+    @staticmethod
+    def _parse_pdb_df(pdb_path: str, pdb_bytes: bytes) -> Dict[str, pd.DataFrame]:
+        """the uncached parser of _read_pdb_df(). parses the {pdb_bytes} read from {pdb_path}.
+        The ASCII check runs on the same bytes that are parsed and fixed-width records are
+        sliced column-wise from a single numpy byte matrix instead of field-by-field in Python."""
+        if not pdb_bytes.isascii():
+            PDBParser._check_valid_pdb(pdb_path) # reports the non-ASCII line and exits
+        pdb_lines = pdb_bytes.decode("ascii").splitlines(True)
+        fixed_width_records = ("ATOM", "HETATM", "ANISOU")
+        record_lines = {record: [] for record in fixed_width_records}
+        record_line_idxs = {record: [] for record in fixed_width_records}
+        others = []
+        for line_idx, line in enumerate(pdb_lines):
+            if not line.strip():
+                continue
+            if line.startswith(fixed_width_records):
+                record = line[:6].rstrip()
+                record_lines[record].append(line.rstrip("\r\n")[:_PDB_LINE_WIDTH].ljust(_PDB_LINE_WIDTH))
+                record_line_idxs[record].append(line_idx)
+            else:
+                others.append([line[:6].rstrip(), line[6:-1].rstrip(), line_idx])
+
+        result = {}
+        for record in fixed_width_records:
+            line_matrix = np.frombuffer("".join(record_lines[record]).encode("ascii"), dtype="S1")
+            line_matrix = line_matrix.reshape(-1, _PDB_LINE_WIDTH)
+            columns = {}
+            for col in pdb_records[record]:
+                start, end = col["line"]
+                field = np.ascontiguousarray(line_matrix[:, start:end]).view(f"S{end - start}").ravel()
+                if col["type"] is str:
+                    columns[col["id"]] = np.char.strip(field).astype(str).astype(object)
+                    continue
+                try:
+                    columns[col["id"]] = field.astype(col["type"])
+                except ValueError:
+                    # same as biopandas: empty or non-numeric values make the whole column NaN
+                    columns[col["id"]] = np.full(len(field), np.nan)
+            columns["line_idx"] = np.array(record_line_idxs[record], dtype=int if record_line_idxs[record] else object)
+            result[record] = pd.DataFrame(columns)
+        result["OTHERS"] = pd.DataFrame(others, columns=[c["id"] for c in pdb_records["OTHERS"]] + ["line_idx"])
+        result["OTHERS"] = result["OTHERS"].astype({c["id"]: c["type"] for c in pdb_records["OTHERS"]})
+
+        return result
+
     @staticmethod
     def _get_target_model(df: pd.DataFrame, model: int) -> Union[pd.DataFrame, None]:
         """
@@ -268,18 +362,35 @@ class PDBParser(StructureParserInterface):
             mdl_start_lines = list(df["OTHERS"][df["OTHERS"].record_name == "MODEL"]["line_idx"])
             mdl_end_lines = list(df["OTHERS"][df["OTHERS"].record_name == "ENDMDL"]["line_idx"])
             mdl_range = list(zip(mdl_start_lines, mdl_end_lines))
-            target_mdl_range = mdl_range[model]
-            mdl_query_pattern = f"line_idx > {target_mdl_range[0]} & line_idx < {target_mdl_range[1]}"
-            # get model dataframe section as a copy
-            target_mdl_df = pd.concat((df["ATOM"], df["HETATM"]), ignore_index=True).query(mdl_query_pattern).copy()
-            target_mdl_ter_df = df["OTHERS"][df["OTHERS"].record_name == "TER"].query(mdl_query_pattern).copy()
+            mdl_start, mdl_end = mdl_range[model]
+
+            def in_target_mdl(sub_df: pd.DataFrame) -> pd.DataFrame:
+                return sub_df[(sub_df.line_idx > mdl_start) & (sub_df.line_idx < mdl_end)]
+
+            # get model dataframe section as a copy (slicing before concat so only the
+            # target model rows are copied and concat already gives a new frame)
+            target_mdl_df = PDBParser._get_atom_site_df(in_target_mdl(df["ATOM"]), in_target_mdl(df["HETATM"]))
+            target_mdl_ter_df = in_target_mdl(df["OTHERS"][df["OTHERS"].record_name == "TER"]).copy()
         else:
-            # get all dataframe as a copy if there"s no MODEL record
-            target_mdl_df = pd.concat((df["ATOM"], df["HETATM"]), ignore_index=True).copy()  # insure unique df id
+            # get all dataframe as a copy if there"s no MODEL record (concat already gives a new frame)
+            target_mdl_df = PDBParser._get_atom_site_df(df["ATOM"], df["HETATM"])
             target_mdl_ter_df = df["OTHERS"][df["OTHERS"].record_name == "TER"].copy()
 
         return target_mdl_df, target_mdl_ter_df
 
+    @staticmethod
+    def _get_atom_site_df(atom_df: pd.DataFrame, hetatm_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        combine the ATOM and HETATM records into one new dataframe with a fresh index.
+        When one of them is empty (e.g.: protein only or ligand only PDB) the other one
+        is copied directly without going through pd.concat.
+        """
+        if len(hetatm_df) == 0:
+            return atom_df.reset_index(drop=True)
+        if len(atom_df) == 0:
+            return hetatm_df.reset_index(drop=True)
+        return pd.concat((atom_df, hetatm_df), ignore_index=True, sort=False)
+
     @classmethod
     def _resolve_missing_chain_id(cls, df: pd.DataFrame, ter_df: pd.DataFrame, allow_multichain_in_atom: bool = False) -> None:
         """
@@ -347,7 +458,7 @@ class PDBParser(StructureParserInterface):
         chain_ids = set(list(map(lambda c_id: c_id.strip(), df["chain_id"])))
         if "" in chain_ids:
             chain_ids.remove("")
-        legal_ids = cls._get_legal_pdb_chain_ids(chain_ids)
+        legal_ids = cls._iter_legal_pdb_chain_ids(chain_ids)
         ## split the df into chain dfs
         ter_line_ids = list(ter_df["line_idx"])
         chain_dfs = split_df_base_on_column_value(df, "line_idx", ter_line_ids)
@@ -381,7 +492,7 @@ class PDBParser(StructureParserInterface):
                     else:
                         # case: no missing chain id; single chain id; HET chain
                         if current_chain_id in recorded_chain_ids:
-                            new_chain_id = legal_ids.pop()
+                            new_chain_id = next(legal_ids)
                             _LOGGER.debug(f"Found repeating chain id in a HETATM chain: assigning a new chain: {new_chain_id}")
                             result_loc_map.extend(list(zip(chain.index, [new_chain_id] * len(chain))))
                             cls._write_idx_change_when_resolve_chain_id(idx_change_mapper, chain, new_chain_id)
@@ -415,7 +526,7 @@ class PDBParser(StructureParserInterface):
                         chains_in_chain = chain.groupby("chain_id", sort=False)
                         for chain_id_in_chain, chain_in_chain in chains_in_chain:
                             if chain_id_in_chain in recorded_chain_ids:
-                                new_chain_id = legal_ids.pop()
+                                new_chain_id = next(legal_ids)
                                 _LOGGER.debug(f"Found repeating chain id in a HETATM chain: assigning a new chain: {new_chain_id}")
                                 result_loc_map.extend(list(zip(chain_in_chain.index, [new_chain_id] * len(chain_in_chain))))
                                 cls._write_idx_change_when_resolve_chain_id(idx_change_mapper, chain_in_chain, new_chain_id)
@@ -426,7 +537,7 @@ class PDBParser(StructureParserInterface):
             else:
                 if len(existing_chain_ids) == 0:
                     # case: all atoms are missing chain id
-                    result_loc_map.extend(list(zip(atom_missing_c_id.index, [legal_ids.pop()] * len(atom_missing_c_id))))
+                    result_loc_map.extend(list(zip(atom_missing_c_id.index, [next(legal_ids)] * len(atom_missing_c_id))))
                 elif len(existing_chain_ids) == 1:
                     # case: only some atoms are missing chain id
                     current_chain_id = list(existing_chain_ids)[0]
@@ -437,7 +548,7 @@ class PDBParser(StructureParserInterface):
                             _LOGGER.error("Found the same chain id in 2 different ATOM chains. Check your PDB.")
                             sys.exit(1)
                         else:
-                            new_chain_id = legal_ids.pop()
+                            new_chain_id = next(legal_ids)
                             _LOGGER.debug(f"Found repeating chain id in a HETATM chain: assigning a new chain: {new_chain_id}")
                             result_loc_map.extend(list(zip(chain.index, [new_chain_id] * len(chain))))
                             cls._write_idx_change_when_resolve_chain_id(idx_change_mapper, chain, new_chain_id)
@@ -464,9 +575,19 @@ class PDBParser(StructureParserInterface):
         Return:
             the legal chain name list in a reversed order (for doing .pop())
         """
-        result = list(string.ascii_uppercase) + list(map(lambda x: str(x), range(50000)))
-        result = list(filter(lambda s: s not in taken_ids, result))
-        return list(reversed(result))
+        taken_ids = set(taken_ids)
+        return [c_id for c_id in reversed(_PDB_CHAIN_ID_CANDIDATES) if c_id not in taken_ids]
+
+    @staticmethod
+    def _iter_legal_pdb_chain_ids(taken_ids) -> Iterator[str]:
+        """
+        Lazy version of _get_legal_pdb_chain_ids() that yields the legal PDB chain names in the order
+        they are .pop()ed from its result. Only the names that are actually used get checked.
+        Arg:
+            taken_ids: iterable that contain all taken chain ids as str
+        """
+        taken_ids = set(taken_ids)
+        return (c_id for c_id in _PDB_CHAIN_ID_CANDIDATES if c_id not in taken_ids)
 
     @staticmethod
     def _write_idx_change_when_resolve_chain_id(idx_change_mapper: dict, df: pd.DataFrame, new_chain_id: str):
@@ -488,53 +609,52 @@ class PDBParser(StructureParserInterface):
         df lines in place. 
         TODO support residue specific keep strageties
         """
-        alt_loc_atoms_df = df[df["alt_loc"].str.strip() != ""]
-        # san check
-        if len(alt_loc_atoms_df) == 0:
+        # san check (a hashed membership test on the column; no row slicing for the common no alt_loc case)
+        alt_loc_mask = ~df["alt_loc"].isin(("", " "))
+        if not alt_loc_mask.any():
             _LOGGER.debug("No alt_loc to resolve.")
             return
-        # solve
+        alt_loc_atoms_df = df.loc[alt_loc_mask, ["residue_number", "chain_id", "alt_loc"]]
+        # solve (column-wise in residues)
+        # only residues with more than 1 alt_loc id need to be resolved
+        alt_loc_ids = alt_loc_atoms_df["alt_loc"]
+        residue_keys = [alt_loc_atoms_df["residue_number"], alt_loc_atoms_df["chain_id"]]
+        alt_loc_residues = alt_loc_ids.groupby(residue_keys, sort=False)
+        need_resolve = alt_loc_residues.transform("nunique") > 1
+        if keep == "first":
+            # the alt_loc id that appears first in each residue
+            keep_ids = alt_loc_residues.transform("first")
+        else:
+            has_keep_id = (alt_loc_ids == keep).groupby(residue_keys, sort=False).transform("any")
+            assert has_keep_id[need_resolve].all()
+            keep_ids = keep
         # get a list of "loc" for deleting in the original df
-        delete_loc_list = []
-        # treat in residues
-        alt_loc_residues = alt_loc_atoms_df.groupby(["residue_number", "chain_id"], sort=False)
-        for r_id_c_id, res_df in alt_loc_residues:
-            alt_res_dfs = res_df.groupby("alt_loc", sort=False)
-            if len(alt_res_dfs) == 1:
-                _LOGGER.debug(f"Only 1 alt_loc id found in residue {r_id_c_id[1], r_id_c_id[0]}. No need to resolve")
-                continue
-            _LOGGER.debug(f"Dealing with alt_loc residue: {r_id_c_id[1], r_id_c_id[0]}")
-            if keep == "first":
-                delele_res_df_locs = list(alt_res_dfs.groups.values())
-                del delele_res_df_locs[0]
-                for delete_lines in delele_res_df_locs:
-                    delete_loc_list.extend(list(delete_lines))
-            else:
-                delele_res_dfs_mapper = alt_res_dfs.groups
-                assert keep in delele_res_dfs_mapper
-                del delele_res_dfs_mapper[keep]
-                for delete_lines in list(delele_res_dfs_mapper.values()):
-                    delete_loc_list.extend(list(delete_lines))
+        delete_loc_list = list(alt_loc_atoms_df.index[need_resolve & (alt_loc_ids != keep_ids)])
 
         # delete in original df
         _LOGGER.debug(f"deleting df row: {delete_loc_list}")
         df.drop(index=delete_loc_list, inplace=True)
 
     @staticmethod
-    def _build_atoms(df: pd.DataFrame) -> Dict[str, Atom]:
+    def _build_atoms(df: pd.DataFrame) -> Dict[tuple, List[Atom]]:
         """
         build atom objects from a "standard" dataframe
         * HETATM should be in seperate chains! HETATM was meant for atoms in the small molecule
           so they cannot be in the same chain as the ATOM atom https://files.wwpdb.org/pub/pdb/doc/format_descriptions/Format_v33_Letter.pdf
         Return:
-            {("chain_id", "residue_idx", "residue_name", "record_name") : [Atom_obj, ...], ...}
+            {("chain_id", "residue_idx", "residue_name") : [Atom_obj, ...], ...}
         """
-        atom_mapper = defaultdict(list)
         df.sort_values("line_idx", inplace=True)
-        for i, row in df.iterrows():
-            atom_obj = Atom.from_biopandas(row)
-            residue_key = (row["chain_id"].strip(), row["residue_number"], row["residue_name"].strip())
-            atom_mapper[residue_key].append(atom_obj)
+        atoms = Atom.from_biopandas_df(df)
+        # group rows by the composite residue key column-wise: factorize the key into
+        # codes (in order of appearance) and split a stable argsort of the codes
+        residue_keys = pd.MultiIndex.from_arrays(
+            [df["chain_id"].str.strip(), df["residue_number"], df["residue_name"].str.strip()])
+        codes, unique_keys = pd.factorize(residue_keys)
+        row_groups = np.split(np.argsort(codes, kind="stable"), np.cumsum(np.bincount(codes))[:-1])
+        atom_mapper = {}
+        for residue_key, rows in zip(unique_keys, row_groups):
+            atom_mapper[residue_key] = [atoms[i] for i in rows]
         return atom_mapper
 
     @classmethod
@@ -552,15 +672,23 @@ class PDBParser(StructureParserInterface):
         Return:
             {"chain_id" : [Residue, ...]}
         """
-        result_mapper = defaultdict(list)
-        for res_key, atoms in atom_mapper.items():
-            res_obj = Residue(int(res_key[1]), res_key[2], atoms)
-            result_mapper[res_key[0]].append(res_obj)  # here it is {"chain_id": Residue()}
+        result_mapper = cls._group_residues_by_chain(atom_mapper)
         # categorize_residue
         cls._categorize_pdb_residue(result_mapper, add_solvent_list, add_ligand_list)
 
         return result_mapper
 
+    @staticmethod
+    def _group_residues_by_chain(atom_mapper: Dict[tuple, List[Atom]]) -> Dict[str, List[Residue]]:
+        """build uncategorized Residue() objects from atom_mapper in one pass and group them by chain id.
+        Return:
+            {"chain_id" : [Residue, ...]} (in the order of atom_mapper)"""
+        result_mapper = defaultdict(list)
+        for res_key, atoms in atom_mapper.items():
+            res_obj = Residue(int(res_key[1]), sys.intern(res_key[2]), atoms)
+            result_mapper[sys.intern(res_key[0])].append(res_obj)  # here it is {"chain_id": Residue()}
+        return result_mapper
+
     @staticmethod
     def _categorize_pdb_residue(residue_mapper: Dict[str, List[Residue]],
                                 add_solvent_list: list = None,
@@ -574,6 +702,10 @@ class PDBParser(StructureParserInterface):
             add_solvent_list = []
         if add_ligand_list is None:
             add_ligand_list = []
+        # name sets are built once per call instead of once per residue
+        solvent_names = set(chem.RD_SOLVENT_LIST).union(add_solvent_list)
+        metal_or_solvent_names = solvent_names.union(chem.METAL_MAPPER)
+        trash_names = set(chem.RD_NON_LIGAND_LIST).difference(add_ligand_list)
         for chain_id, residues in residue_mapper.items():
             peptide_chain = 0
             for residue in residues:
@@ -588,7 +720,7 @@ class PDBParser(StructureParserInterface):
                 # only non-canonical aa can be in a peptide chain
                 for i, residue in enumerate(residues):
                     if residue.rtype == chem.ResidueType.UNKNOWN:
-                        if residue.name in list(chem.METAL_MAPPER.keys()) + chem.RD_SOLVENT_LIST + add_solvent_list:
+                        if residue.name in metal_or_solvent_names:
                             _LOGGER.error(
                                 f"a metal or solvent residue name is found in an peptide chain {chain_id}: {residue.idx} {residue.name}")
                             sys.exit(1)
@@ -618,11 +750,11 @@ class PDBParser(StructureParserInterface):
                     residue_mapper[chain_id][i] = residue_to_metal(residue)
                     continue
                 # if solvent
-                if residue.name in chem.RD_SOLVENT_LIST + add_solvent_list:
+                if residue.name in solvent_names:
                     _LOGGER.debug(f"found solvent {chain_id} {residue.idx}")
                     residue_mapper[chain_id][i] = residue_to_solvent(residue)
                     continue
-                if residue.name in (set(chem.RD_NON_LIGAND_LIST) - set(add_ligand_list)):
+                if residue.name in trash_names:
                     _LOGGER.debug(f"found trash {chain_id} {residue.idx}")
                     residue.rtype = chem.ResidueType.TRASH
                     continue
@@ -820,7 +952,7 @@ def get_pdb_df(pdb: str, fix_chain_id: bool = True) -> pd.DataFrame:
     The idea is chain id information is already implicitly defined by TER lines
     Fixing it is just make it explicit"""
     df: pd.DataFrame = PandasPdb().read_pdb(pdb).df
-    result = pd.concat((df["ATOM"], df["HETATM"]), ignore_index=True)
+    result = PDBParser._get_atom_site_df(df["ATOM"], df["HETATM"])
     result.sort_values("line_idx", inplace=True)
     if fix_chain_id:
         pdb_ter_df = df["OTHERS"][df["OTHERS"].record_name == "TER"]
@@ -5,6 +5,7 @@ this parser only. The PrepinParser has no private data and serves as a namespace
 Author: Qianzhen Shao <shaoqz@icloud.com>
 Date: 2023-10-17
 """
+import itertools
 from typing import Dict, List
 
 from ._interface import StructureParserInterface
@@ -50,6 +51,24 @@ class PrepinParser(StructureParserInterface):
         res = cls._build_residue(atoms, prepin_data)
         return convert_res_to_structure(res)
 
+    @classmethod
+    def get_residue_name(cls, path: str) -> str:
+        """get the residue name (NAMRES) of a .prepin file by reading only its header
+        sections (-1- to -6-) instead of parsing the whole file into a Structure().
+        Gives the same name as get_structure(path).residues[0].name"""
+        if not fs.has_content( path ):
+            _LOGGER.error(f"The supplied file {path} does not exist or is empty. Exiting...")
+            raise ValueError
+        with open(path) as f:
+            lines = list(itertools.islice(f, 6))
+        # same support check as get_structure
+        if cls._parse_icontrol(lines[5])["IFIXC"] == "CHANGE":
+            _LOGGER.error("Does not support parse CHANGE prepin file to Structure() yet. "
+                          f"Please post an issue if really needed. ({path})")
+            raise FileFormatError
+
+        return cls._parse_resname(lines[4])["NAMRES"]
+
     @classmethod
     def get_file_str(cls, stru: Structure) -> str:
         """convert a Structure() to .prepin file content. Only 1 residue unit is allowed in the stru"""
@@ -6,9 +6,9 @@ Author: Qianzhen Shao <shaoqz@icloud.com>
 Date: 2023-10-28
 """
 from collections import defaultdict
+import copy
 from typing import Dict, List
 import re
-from itertools import chain
 import periodictable
 
 from ._interface import StructureParserInterface
@@ -18,6 +18,7 @@ from .pdb_io import PDBParser
 from enzy_htp.chemical.solvent import RD_SOLVENT_LIST
 import enzy_htp.core.file_system as fs
 import enzy_htp.core.fortran_helper as fh
+from enzy_htp.core.general import ContentDigestCache
 from enzy_htp.core.logger import _LOGGER
 from enzy_htp.core.exception import FileFormatError
 
@@ -28,6 +29,9 @@ class PrmtopParser(StructureParserInterface):
             ncaa_chrgspin_mapper = {}
         self.ncaa_chrgspin_mapper = ncaa_chrgspin_mapper
 
+    _prmtop_data_cache = ContentDigestCache(maxsize=4)
+    """parsed data of the last few prmtop files read by _parse_prmtop_file()"""
+
     def get_structure(
             self,
             path: str,
@@ -122,14 +126,14 @@ class PrmtopParser(StructureParserInterface):
         next_pointers = data["RESIDUE_POINTER"][1:] + [None]
         residue_data_list = zip(data["RESIDUE_LABEL"], data["RESIDUE_POINTER"], next_pointers, data["RESIDUE_CHAINID"], data["RESIDUE_NUMBER"])
         taken_ch_ids = set(data["RESIDUE_CHAINID"])
-        legal_ch_ids = PDBParser._get_legal_pdb_chain_ids(taken_ch_ids)
+        legal_ch_ids = PDBParser._iter_legal_pdb_chain_ids(taken_ch_ids)
         legal_res_idx = cls._get_legal_residue_idxes(data["RESIDUE_NUMBER"])
         solvent_list = ["Na+", "Cl-"] + RD_SOLVENT_LIST + add_solvent_list
         for name, pointer, next_pointer, chain_id, idx in residue_data_list:
             # resolve chain id
             if chain_id is None:
                 if name in solvent_list:
-                    chain_id = legal_ch_ids.pop()
+                    chain_id = next(legal_ch_ids)
                     _LOGGER.debug("Found solvent with out chain id in prmtop. "
                                   f"Assigning new chain: {chain_id}.")
                 else:
@@ -205,21 +209,31 @@ class PrmtopParser(StructureParserInterface):
             "DATE" : "01/03/24 16:27:03",
             "TITLE" : "default_name",
             ...
-            }"""
+            }
+        Parsed results of the last few files are cached on a digest of the file content
+        (and the parser class) so re-reading unchanged content skips the parsing.
+        A deep copy of the cached data is returned each time."""
         if not fs.has_content( path ):
             _LOGGER.error(f"The supplied file {path} does not exist or is empty. Exiting...")
             raise ValueError
 
-        result = {}
         content: str = fs.content_from_file( path )
+        cached_data = cls._prmtop_data_cache.get(content.encode(), lambda: cls._parse_prmtop_content(content), tag=cls)
+        return copy.deepcopy(cached_data)
+
+    @classmethod
+    def _parse_prmtop_content(cls, content: str) -> Dict:
+        """the uncached parser of _parse_prmtop_file(). parses the {content} of a prmtop file."""
+        result = {}
         sections = re.split(r"^%FLAG", content, flags=re.MULTILINE)
+        section_parsers = cls.section_parser_mapper()
 
         for sec in sections:
             if sec.find("%VERSION") != -1:
                 result.update(cls._parse_version(sec))
                 continue
             sec_name = sec.splitlines()[0].strip()
-            result.update(cls.section_parser_mapper()[sec_name](sec))
+            result.update(section_parsers[sec_name](sec))
 
         return result
 
@@ -300,9 +314,8 @@ class PrmtopParser(StructureParserInterface):
         (key, fmt, body) = content.split('\n', 2) # TODO this not work when multiple FORMAT is in the file but it is a rare case when IFPERT == 1
         key = key.strip()
         fmt = fmt.strip().lstrip("%")
-        body = re.sub('\n', '', body)
-        data = fh.parse_data(fmt, body, reduce=False)
-        data = list(chain.from_iterable(data))
+        body = body.replace('\n', '')
+        data = fh.parse_flat_data(fmt, body)
         return {key : data}
 
     @classmethod
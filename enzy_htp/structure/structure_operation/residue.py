@@ -8,8 +8,9 @@ Date: 2023-03-20
 
 from typing import Tuple, Union, List
 
+import numpy as np
+
 from enzy_htp.core.logger import _LOGGER
-from enzy_htp.core import math_helper as mh
 import enzy_htp.chemical as chem
 from ..structure import Structure, Residue, Atom
 
@@ -132,16 +133,10 @@ def closest_n_residues(
     Returns:
         A List[Residue] containing the closest n residues.
     """
-    target_coord = target.geom_center
-    distances = list()
-    for res in target.root().residues:
-        if res == target:
-            continue
-        
-        distances.append((mh.get_distance(target_coord, res.geom_center), res))
-
-    distances = sorted(distances, key=lambda pr: pr[0])
-    result = list()
-    for (_, res) in distances[:n]:
-        result.append( res )        
-    return result
+    other_residues = [res for res in target.root().residues if res is not target]
+    if not other_residues:
+        return []
+    # rank all distances at once (stable so ties keep the structure order)
+    centers = np.array([res.geom_center for res in other_residues], dtype=float)
+    distances = np.linalg.norm(centers - np.array(target.geom_center, dtype=float), axis=1)
+    return [other_residues[i] for i in np.argsort(distances, kind="stable")[:n]]
@@ -1,5 +1,10 @@
+import os
 import pytest
 
+from enzy_htp import PDBParser
+
+STRUCTURE_DATA_DIR = f"{os.path.dirname(os.path.abspath(__file__))}/structure/data/"
+
 
 class Helpers:
     """helper functions for unit tests in EnzyHTP"""
@@ -39,3 +44,9 @@ class Helpers:
 @pytest.fixture
 def helpers():
     return Helpers
+
+
+@pytest.fixture(scope="session")
+def ke07_stru():
+    """KE_07_R7_2_S.pdb parsed once for the session. tests should not modify it."""
+    return PDBParser().get_structure(f"{STRUCTURE_DATA_DIR}KE_07_R7_2_S.pdb")
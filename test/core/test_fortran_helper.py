@@ -73,3 +73,20 @@ def test_parse_data():
     assert result == [
         ["defa", "ult_", "name"],
     ]
+
+def test_parse_flat_data():
+    """check parse_flat_data() gives the chained result of parse_data()"""
+    test_data = ("    3978      15    2000    2009    4555    2708    9050    8604"
+    "       0       0   21922     254    2009    2708    8604      72     161")
+    test_fmt = "FORMAT(10I8)"
+    assert fh.parse_flat_data(test_fmt, test_data) == [
+        3978, 15, 2000, 2009, 4555, 2708, 9050, 8604, 0, 0, 21922, 254, 2009, 2708, 8604, 72, 161
+    ]
+
+    test_data = ("    3978      15N   H1      2000    2009N   H1  ")
+    test_fmt = "FORMAT(2I8, 2a4)"
+    assert fh.parse_flat_data(test_fmt, test_data) == [3978, 15, "N", "H1", 2000, 2009, "N", "H1"]
+
+    test_data = ("default_name    CA  ")
+    test_fmt = "FORMAT(20a4)"
+    assert fh.parse_flat_data(test_fmt, test_data) == ["defa", "ult_", "name", None, "CA"]
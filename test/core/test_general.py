@@ -86,3 +86,14 @@ def test_split_but_brackets_more_layer():
     """as name. a failed case. TODO"""
     test_pattern = "'[1,1, [1,1], 1], (0,10,(1,1))"
     assert len(eg.split_but_brackets(test_pattern, ",")) == 2
+
+def test_content_digest_cache():
+    """test the cache hits on the same content and tag and misses on changed content"""
+    test_cache = eg.ContentDigestCache(maxsize=2)
+    assert test_cache.get(b"abc", lambda: 1) == 1
+    assert test_cache.get(b"abc", lambda: 2) == 1
+    assert test_cache.get(b"abd", lambda: 3) == 3
+    assert test_cache.get(b"abc", lambda: 4, tag="other") == 4
+    assert (test_cache.hits, test_cache.misses) == (1, 3)
+    # least recently used b"abc" was dropped
+    assert test_cache.get(b"abc", lambda: 5) == 5
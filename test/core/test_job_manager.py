@@ -170,7 +170,7 @@ cluster = clusters.accre.Accre()
 CURR_FILE = os.path.abspath(__file__)
 CURR_DIR = os.path.dirname(CURR_FILE)
 test_sub_dir = f"{CURR_DIR}/data"
-test_file_paths = [f"{test_sub_dir}QM_test.out"] # paths to be cleaned
+test_file_paths = {f"{test_sub_dir}QM_test.out"} # paths to be cleaned (deduplicated)
 
 def test_ClusterJob_config_by_env_list():
     job = ClusterJob.config_job(
@@ -228,8 +228,8 @@ def test_ClusterJob_config_also_submit_info():
         sub_script_path=test_sub_script_path
     )
     info = job.submit(debug=1)
-    test_file_paths.append(test_sub_script_path)
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.add(test_sub_script_path)
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
     assert info == (f"sbatch {os.path.abspath(test_sub_script_path)}", test_sub_dir, test_sub_script_path)
 
 def test_ClusterJob_preset():
@@ -249,8 +249,8 @@ def test_ClusterJob_submit_job_id_ACCRE():
     job = ClusterJob(clusters.accre.Accre(), sub_script_str=sub_script_str)
     job.submit( sub_dir=test_sub_dir,
                 script_path=f"{test_sub_dir}/test.cmd")
-    test_file_paths.extend([job.job_cluster_log, job.sub_script_path])
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.update([job.job_cluster_log, job.sub_script_path])
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
     run(f"scancel {job.job_id}", timeout=20, check=True,  text=True, shell=True, capture_output=True)
     assert len(job.job_cluster_log) > 0
     assert len(job.job_id) > 0
@@ -262,8 +262,8 @@ def test_ClusterJob_submit_default_script_path_ACCRE():
     """
     job = ClusterJob(clusters.accre.Accre(), sub_script_str=sub_script_str)
     job.submit(sub_dir=test_sub_dir)
-    test_file_paths.extend([job.job_cluster_log, job.sub_script_path])
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.update([job.job_cluster_log, job.sub_script_path])
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
     # use explictly the scancel here to decouple the test
     run(f"scancel {job.job_id}", timeout=20, check=True,  text=True, shell=True, capture_output=True)
     assert len(job.job_id) > 0
@@ -275,8 +275,8 @@ def test_ClusterJob_kill_job_ACCRE():
     """
     job = ClusterJob(clusters.accre.Accre(), sub_script_str=sub_script_str)
     job.submit(sub_dir=test_sub_dir)
-    test_file_paths.extend([job.job_cluster_log, job.sub_script_path])
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.update([job.job_cluster_log, job.sub_script_path])
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
     job.kill()
 
 @pytest.mark.accre
@@ -286,8 +286,8 @@ def test_ClusterJob_get_state_ACCRE():
     """
     job = ClusterJob(clusters.accre.Accre(), sub_script_str=sub_script_str)
     job.submit(sub_dir=test_sub_dir)
-    test_file_paths.extend([job.job_cluster_log, job.sub_script_path])
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.update([job.job_cluster_log, job.sub_script_path])
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
     assert job.get_state()[0] in ["pend", "run"]
     job.kill()
     assert job.get_state()[0] == "cancel"
@@ -301,8 +301,8 @@ def test_ClusterJob_wait_to_end_ACCRE():
     job = ClusterJob(clusters.accre.Accre(), sub_script_str=sub_script_str)
     # submit and record the file
     job.submit(sub_dir=test_sub_dir)
-    test_file_paths.extend([job.job_cluster_log, job.sub_script_path])
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.update([job.job_cluster_log, job.sub_script_path])
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
 
     old_level = get_eh_logging_level()
     _LOGGER.setLevel(logging.DEBUG)
@@ -325,9 +325,9 @@ def test_ClusterJob_wait_to_array_end_ACCRE():
     _LOGGER.setLevel(logging.DEBUG)
 
     ClusterJob.wait_to_array_end(jobs, period=30, array_size=5)
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
     for i, job in enumerate(jobs):
-        test_file_paths.extend([job.sub_script_path, job.job_cluster_log, f"{job.sub_dir}/QM_test_{i}.out"])
+        test_file_paths.update([job.sub_script_path, job.job_cluster_log, f"{job.sub_dir}/QM_test_{i}.out"])
     for job in jobs:
         assert job.job_id is not None
         assert job.last_state[0][0] in ("complete", "cancel", "error")
@@ -349,9 +349,9 @@ def test_ClusterJob_wait_to_array_end_plus_ACCRE():
     _LOGGER.setLevel(logging.DEBUG)
 
     ClusterJob.wait_to_array_end_plus(jobs, period=3, array_size=5)
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
     for i, job in enumerate(jobs):
-        test_file_paths.extend([job.sub_script_path, job.job_cluster_log, f"{job.sub_dir}/QM_test_{i}.out"])
+        test_file_paths.update([job.sub_script_path, job.job_cluster_log, f"{job.sub_dir}/QM_test_{i}.out"])
     for job in jobs:
         assert job.job_id is not None
         assert job.last_state[0][0] in ("complete", "cancel", "error")
@@ -377,9 +377,9 @@ def test_ClusterJob_wait_to_array_end_plus_rerun_ACCRE(caplog):
     with EnablePropagate(_LOGGER):
         ClusterJob.wait_to_array_end_plus(jobs, period=3, array_size=5) # It will raise or warn if there is a resubmit of repeating
     assert "re-submitting a finished job" not in caplog.text
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
     for i, job in enumerate(jobs):
-        test_file_paths.extend([job.sub_script_path, job.job_cluster_log, f"{job.sub_dir}/QM_test_{i}.out"])
+        test_file_paths.update([job.sub_script_path, job.job_cluster_log, f"{job.sub_dir}/QM_test_{i}.out"])
     for job in jobs:
         assert job.job_id is not None
         assert job.last_state[0][0] == "complete"
@@ -417,13 +417,13 @@ def test_ClusterJob_with_to_2d_array_end_ACCRE():
             assert job.job_id is not None
             assert job.last_state[0][0] in ("complete", "cancel", "error")
 
-    test_file_paths.append(f"{test_sub_dir}/submitted_job_ids.log")
+    test_file_paths.add(f"{test_sub_dir}/submitted_job_ids.log")
     for i, job_list_1d in enumerate(jobs):
         for job in job_list_1d:
-            test_file_paths.extend([job.sub_script_path, job.job_cluster_log])
+            test_file_paths.update([job.sub_script_path, job.job_cluster_log])
     out_files = glob.glob(f"{test_sub_dir}/QM_test_*.out")
     if out_files:
-        test_file_paths.extend(out_files)
+        test_file_paths.update(out_files)
     fs.clean_temp_file_n_dir(test_file_paths)
     _LOGGER.setLevel(old_level)
 
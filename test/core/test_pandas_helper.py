@@ -0,0 +1,52 @@
+"""Testing enzy_htp.core.pandas_helper.py
+Author: Qianzhen (QZ) Shao <shaoqz@icloud.com>
+Date: 2022-10-21
+"""
+import pandas as pd
+from enzy_htp.core.pandas_helper import batch_edit_df_loc_value, split_df_base_on_column_value
+
+
+def test_batch_edit_df_loc_value():
+    """test editing selected locs of a column in place"""
+    df = pd.DataFrame({"chain_id": ["", "", "B", ""], "residue_number": [1, 2, 3, 4]})
+    batch_edit_df_loc_value(df, [(0, "A"), (1, "A"), (3, "C"), (3, "D")], "chain_id")
+    assert list(df["chain_id"]) == ["A", "A", "B", "D"]
+    assert list(df["residue_number"]) == [1, 2, 3, 4]
+
+
+def test_batch_edit_df_loc_value_empty():
+    """test an empty edit list leaves the dataframe untouched"""
+    df = pd.DataFrame({"chain_id": ["", "B"]})
+    batch_edit_df_loc_value(df, [], "chain_id")
+    assert list(df["chain_id"]) == ["", "B"]
+
+
+def test_batch_edit_df_loc_value_new_loc():
+    """test a loc not in the index enlarges the dataframe as a per-item .loc does"""
+    df = pd.DataFrame({"chain_id": ["", "", "B"]})
+    batch_edit_df_loc_value(df, [(0, "A"), (5, "X"), (1, "A")], "chain_id")
+    assert df["chain_id"].to_dict() == {0: "A", 1: "A", 2: "B", 5: "X"}
+
+
+def test_batch_edit_df_loc_value_list_like_value():
+    """test a list-like value is assigned to its single cell"""
+    df = pd.DataFrame({"chain_id": ["", "", "B"]})
+    batch_edit_df_loc_value(df, [(0, ("A", "B")), (1, "C")], "chain_id")
+    assert df["chain_id"].to_dict() == {0: ("A", "B"), 1: "C", 2: "B"}
+
+
+def test_split_df_base_on_column_value():
+    """test splitting on values in and not in the column. rows on a split value are dropped"""
+    df = pd.DataFrame({"line_idx": [0, 1, 2, 4, 5, 7, 9], "x": list("abcdefg")}, index=range(10, 17))
+    result = split_df_base_on_column_value(df, "line_idx", [6, 3, 5, 8])
+    assert [list(df_i["x"]) for df_i in result] == [["a", "b", "c"], ["d"], [], ["f"], ["g"]]
+    assert list(result[0].index) == [10, 11, 12]
+    assert list(result[3].index) == [15]
+
+
+def test_split_df_base_on_column_value_no_split():
+    """test an empty split list gives the whole dataframe"""
+    df = pd.DataFrame({"line_idx": [0, 1]})
+    result = split_df_base_on_column_value(df, "line_idx", [])
+    assert len(result) == 1
+    assert result[0] is df
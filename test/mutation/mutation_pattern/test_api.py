@@ -20,11 +20,10 @@ sp = PDBParser()
 
 
 @pytest.mark.interface
-def test_decode_mutation_pattern():
+def test_decode_mutation_pattern(ke07_stru):
     """dev run of the function"""
     test_mutation_pattern = ("KA162A, {RA154W, HA201A}," " {L10A, r:2[resi 254 around 3:all not self]*5}")
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
 
     mutants = m_p.decode_mutation_pattern(test_stru, test_mutation_pattern)
     assert len(mutants) == 7
@@ -71,11 +70,10 @@ def test_get_section_type_bad():
     assert exe.type == InvalidMutationPatternSyntax
 
 
-def test_decode_direct_mutation():
+def test_decode_direct_mutation(ke07_stru):
     """test the function works as expected using a made up pattern and manually
     curated answer. test giving default chain id"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_d_pattern = "RA154W"
     test_d_pattern_1 = "R154W"
     answer = Mutation(orig="ARG", target="TRP", chain_id="A", res_idx=154)
@@ -84,10 +82,9 @@ def test_decode_direct_mutation():
     assert m_p.decode_direct_mutation(test_stru, test_d_pattern_1) == [[answer]]
 
 
-def test_decode_mutation_esm_pattern():
+def test_decode_mutation_esm_pattern(ke07_stru):
     """test function works as expected, test using pickle obj of a confirmed run"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_pattern = "resi 254 around 5:all not self, resi 2:larger"
     answer_path = f"{DATA_DIR}mutation_esm_answer.pickle"
     mutation_esm = m_p.decode_mutation_esm_pattern(test_stru, test_pattern)
@@ -98,22 +95,20 @@ def test_decode_mutation_esm_pattern():
     assert answer == mutation_esm
 
 
-def test_decode_mutation_esm_pattern_share_point():
+def test_decode_mutation_esm_pattern_share_point(ke07_stru):
     """test the case that there are shared positions from different
     mutation_esm_pattern s"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_pattern = "resi 9:all not self, resi 254 around 3:charge+"
     mutation_esm = m_p.decode_mutation_esm_pattern(test_stru, test_pattern)
     assert len(mutation_esm[('A', 9)]) == 19
 
 
-def test_decode_random_mutation(caplog):
+def test_decode_random_mutation(ke07_stru, caplog):
     """test the function works as expected using a made up pattern and manually
     curated answer. test of non repeat case
     Use a random seed to control the test to contain a repeating random result"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_pattern = "r:2[resi 254 around 3:all not self]*10"
     # find a seed that have repeating mutant
     # i = True
@@ -132,12 +127,11 @@ def test_decode_random_mutation(caplog):
     assert "repeating MUTANT is generated" in caplog.text
 
 
-def test_decode_random_mutation_allow_repeat(caplog):
+def test_decode_random_mutation_allow_repeat(ke07_stru, caplog):
     """test the function works as expected using a made up pattern and manually
     curated answer. test of non repeat case
     Use a random seed to control the test to contain a repeating random result"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_pattern = "r:2R[resi 254 around 3:all not self]*10R"
     np.random.seed(457)  # seed that contains a repeating mutant
 
@@ -148,34 +142,31 @@ def test_decode_random_mutation_allow_repeat(caplog):
     assert "repeating mutation is generated" in caplog.text
 
 
-def test_decode_all_mutation():
+def test_decode_all_mutation(ke07_stru):
     """test the function works as expected using a made up pattern and manually
     curated answer."""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_pattern = "a:[resi 253:all not self, resi 252:larger]"
 
     mutants = m_p.decode_all_mutation(test_stru, test_pattern)
     assert len(mutants) == 400
 
 
-def test_decode_all_mutation_m_flag():
+def test_decode_all_mutation_m_flag(ke07_stru):
     """test the function with the flag M specificed
     works as expected using a made up pattern and manually
     curated answer."""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_pattern = "a:M[resi 253:all not self, resi 252:larger]"
 
     mutants = m_p.decode_all_mutation(test_stru, test_pattern)
     assert len(mutants) == 361
 
 
-def test_combine_section_mutant_one_to_many():
+def test_combine_section_mutant_one_to_many(ke07_stru):
     """test the function works as expected in the case that
     single mutant combine with many mutants"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_sec_1 = "a:[resi 253:all not self, resi 252:larger]"
     test_sec_3 = "L10A"
     # build per-section mutant mapper
@@ -188,11 +179,10 @@ def test_combine_section_mutant_one_to_many():
         assert Mutation(orig='LEU', target='ALA', chain_id='A', res_idx=10) in mut
 
 
-def test_combine_section_mutant_one_section():
+def test_combine_section_mutant_one_section(ke07_stru):
     """test the function works as expected in the case that
     single mutant combine with many mutants"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_sec_1 = "a:[resi 253+252:all not self]"
     # build per-section mutant mapper
     p_mutant_mapper = {}
@@ -201,10 +191,9 @@ def test_combine_section_mutant_one_section():
     assert len(mutants) == 400
 
 
-def test_combine_section_mutant_many_to_many():
+def test_combine_section_mutant_many_to_many(ke07_stru):
     """test the function works as expected"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_sec_1 = "a:[resi 253:all not self, resi 252:larger]"
     test_sec_2 = "r:2[resi 254 around 3:all not self]*5"
     # build per-section mutant mapper
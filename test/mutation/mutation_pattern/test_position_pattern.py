@@ -16,10 +16,9 @@ DATA_DIR = f"{CURR_DIR}/../data/"
 sp = PDBParser()
 
 
-def test_decode_position_pattern():
+def test_decode_position_pattern(ke07_stru):
     """test the function use a made up position_pattern for KE"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_pattern = "resi 254 around 4"
 
     assert set(m_p.decode_position_pattern(test_stru, test_pattern)) == set([('A', 224), ('A', 202), ('A', 9), ('A', 201), ('A', 48),
@@ -37,11 +36,10 @@ def test_decode_position_pattern_dimer():
                                                                              ('A', 391), ('A', 271), ('A', 266), ('A', 388),
                                                                              ('B', 719)])  # note ligand wont be included
 
-def test_decode_builtin_function():
+def test_decode_builtin_function(ke07_stru):
     """test the function use a made up builtin_function pattern for KE"""
 
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_pattern = "$ef_hotspot('B.254.CAE', 'B.254.H2', (170,180))"
 
     existing_level = _LOGGER.level
@@ -53,14 +51,13 @@ def test_decode_builtin_function():
 
     assert set([res.key_str for res in result]) == set(["A.21", "A.24", "A.22", "A.228"])
 
-def test_decode_builtin_function_vec():
+def test_decode_builtin_function_vec(ke07_stru):
     """test the function use a made up builtin_function pattern for KE.
     test the dispatch on using vector"""
     existing_level = _LOGGER.level
     _LOGGER.setLevel(logging.DEBUG)
 
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
+    test_stru = ke07_stru
     test_pattern = "$ef_hotspot((-0.373, -0.1285, 0.369), (22.665,-2.5785,-52.461), (170,180))"
     result = m_p.decode_builtin_function(test_stru, test_pattern)
     _LOGGER.setLevel(existing_level)
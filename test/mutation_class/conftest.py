@@ -0,0 +1,15 @@
+"""Shared fixtures for testing the enzy_htp.mutation_class submodule.
+ke07_stru is shared from test/conftest.py
+"""
+import os
+import pytest
+
+import enzy_htp.structure as es
+
+DATA_DIR = f"{os.path.dirname(os.path.abspath(__file__))}/../mutation/data/"
+
+
+@pytest.fixture(scope="session")
+def one_res_stru():
+    """one_res.pdb parsed once for the session. tests should not modify it."""
+    return es.PDBParser().get_structure(f"{DATA_DIR}one_res.pdb")
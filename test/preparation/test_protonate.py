@@ -318,3 +318,26 @@ def test_protonate_stru_imputed():
     prot.protonate_stru(stru)
 
     assert stru
+
+
+def test_ob_pdb_charge():
+    """test extracting the net formal charge from the PDB charge column"""
+    test_pdb = f"{WORK_DIR}ob_pdb_charge_test.pdb"
+    fs.write_lines(test_pdb, [
+        "ATOM      1  N   ALA A   1      11.104   6.134  -6.504  1.00  0.00           N1+",
+        "ATOM      2  CA  ALA A   1      11.639   6.071  -5.147  1.00  0.00           C",
+        "HETATM    3  O1  LIG B   2      11.639   6.071  -5.147  1.00  0.00           O1-",
+        "HETATM    4  O2  LIG B   2      11.639   6.071  -5.147  1.00  0.00           O2-",
+        "TER",
+        "END",
+    ])
+    assert prot._ob_pdb_charge(test_pdb) == -2
+    fs.safe_rm(test_pdb)
+
+
+def test_ob_pdb_charge_empty_file():
+    """test an empty PDB file has no formal charge"""
+    test_pdb = f"{WORK_DIR}ob_pdb_charge_empty_test.pdb"
+    fs.write_lines(test_pdb, [])
+    assert prot._ob_pdb_charge(test_pdb) == 0
+    fs.safe_rm(test_pdb)
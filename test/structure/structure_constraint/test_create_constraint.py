@@ -5,7 +5,6 @@ Date: 2023-02-02
 import pytest
 import os
 
-from enzy_htp import PDBParser
 from enzy_htp.core.logger import _LOGGER
 from enzy_htp.core.general import EnablePropagate
 import enzy_htp.structure.structure_constraint as stru_cons
@@ -13,106 +12,69 @@ import enzy_htp.structure.structure_constraint as stru_cons
 CURR_FILE = os.path.abspath(__file__)
 CURR_DIR = os.path.dirname(CURR_FILE)
 DATA_DIR = f"{CURR_DIR}/../data/"
-sp = PDBParser()
 
-def test_create_distance_constraint():
-    "test function works as expected"
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
-    test_cons = stru_cons.create_distance_constraint(
-        "B.254.H2", "A.101.OE2", 2.4, test_stru)
+@pytest.mark.parametrize("create_func,atom_keys,target_value,expected_constraint_type,expected_atom_names,expected_r", [
+    (stru_cons.create_distance_constraint, ("B.254.H2", "A.101.OE2"), 2.4,
+     "distance_constraint", {"H2", "OE2"}, ("x-0.25", "x-0.05", "x+0.05", "x+0.25")),
+    (stru_cons.create_angle_constraint, ("B.254.CAE", "B.254.H2", "A.101.OE2"), 180.0,
+     "angle_constraint", {"H2", "OE2", "CAE"}, ("x-30.0", "x-10.0", "x+10.0", "x+30.0")),
+    (stru_cons.create_dihedral_constraint, ("B.254.CAE", "B.254.H2", "A.101.OE2", "A.101.CA"), 0.0,
+     "dihedral_constraint", {"H2", "OE2", "CAE", "CA"}, ("x-30.0", "x-10.0", "x+10.0", "x+30.0")),
+], ids=["distance", "angle", "dihedral"])
+def test_create_constraint(ke07_stru, create_func, atom_keys, target_value,
+                           expected_constraint_type, expected_atom_names, expected_r):
+    "test the create_xxx_constraint functions work as expected"
+    test_cons = create_func(*atom_keys, target_value, ke07_stru)
     assert test_cons.params["amber"] == {
         "rs_filepath": "{mdstep_dir}/0.rs",
         "ialtd" : 0,
-        "r1" : "x-0.25",
-        "r2" : "x-0.05",
-        "r3" : "x+0.05",
-        "r4" : "x+0.25",
-        "rk2": 200.0, "rk3": 200.,
-    }
-    assert test_cons.constraint_type == "distance_constraint"
-    assert test_cons.atom_names == {"H2", "OE2"}
-    assert test_cons.target_value == 2.4
-
-def test_create_angle_constraint():
-    "test function works as expected"
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
-    test_cons = stru_cons.create_angle_constraint(
-        "B.254.CAE", "B.254.H2", "A.101.OE2", 180.0, test_stru)
-    assert test_cons.params["amber"] == {
-        "rs_filepath": "{mdstep_dir}/0.rs",
-        "ialtd" : 0,
-        "r1" : "x-30.0",
-        "r2" : "x-10.0",
-        "r3" : "x+10.0",
-        "r4" : "x+30.0",
+        "r1" : expected_r[0],
+        "r2" : expected_r[1],
+        "r3" : expected_r[2],
+        "r4" : expected_r[3],
         "rk2": 200.0, "rk3": 200.0,
     }
-    assert test_cons.constraint_type == "angle_constraint"
-    assert test_cons.atom_names == {"H2", "OE2", "CAE"}
-    assert test_cons.target_value == 180.0
+    assert test_cons.constraint_type == expected_constraint_type
+    assert test_cons.atom_names == expected_atom_names
+    assert test_cons.target_value == target_value
 
-def test_create_dihedral_constraint():
-    "test function works as expected"
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
-    test_cons = stru_cons.create_dihedral_constraint(
-        "B.254.CAE", "B.254.H2", "A.101.OE2", "A.101.CA", 0.0, test_stru)
-    assert test_cons.params["amber"] == {
-        "rs_filepath": "{mdstep_dir}/0.rs",
-        "ialtd" : 0,
-        "r1" : "x-30.0",
-        "r2" : "x-10.0",
-        "r3" : "x+10.0",
-        "r4" : "x+30.0",
-        "rk2": 200.0, "rk3": 200.0,
-    }
-    assert test_cons.constraint_type == "dihedral_constraint"
-    assert test_cons.atom_names == {"H2", "OE2", "CAE", "CA"}
-    assert test_cons.target_value == 0.0
+@pytest.fixture
+def cart_freeze_list(ke07_stru):
+    """fresh overlapping CartesianFreeze()s on ke07_stru for each test"""
+    atoms = ke07_stru.atoms
+    return [
+        stru_cons.CartesianFreeze(atoms=atoms[0:10]),
+        stru_cons.CartesianFreeze(atoms=atoms[5:12]),
+        stru_cons.CartesianFreeze(atoms=atoms[20:22]),]
 
-def test_merge_cartesian_freeze():
+def test_merge_cartesian_freeze(ke07_stru, cart_freeze_list):
     """test a correct case"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
-    test_cons_list = [
-        stru_cons.CartesianFreeze(atoms=test_stru.atoms[0:10]),
-        stru_cons.CartesianFreeze(atoms=test_stru.atoms[5:12]),
-        stru_cons.CartesianFreeze(atoms=test_stru.atoms[20:22]),]
+    test_cons_list = cart_freeze_list
     merged_cons = stru_cons.merge_cartesian_freeze(test_cons_list)
-    assert set(merged_cons.atoms) == set(test_stru.atoms[0:12]+test_stru.atoms[20:22])
+    atoms = ke07_stru.atoms
+    assert set(merged_cons.atoms) == set(atoms[0:12]+atoms[20:22])
     assert merged_cons.params == test_cons_list[0].params
 
-def test_merge_cartesian_freeze_wrong(caplog):
+def test_merge_cartesian_freeze_wrong(cart_freeze_list, caplog):
     """test a wrong case"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
-    test_cons_list = [
-        stru_cons.CartesianFreeze(atoms=test_stru.atoms[0:10]),
-        stru_cons.CartesianFreeze(atoms=test_stru.atoms[5:12]),
-        stru_cons.CartesianFreeze(atoms=test_stru.atoms[20:22]),]
+    test_cons_list = cart_freeze_list
     test_cons_list[0].params = {}
     with EnablePropagate(_LOGGER):
         with pytest.raises(ValueError) as e:    
             merged_cons = stru_cons.merge_cartesian_freeze(test_cons_list)
             assert "Inconsistent params" in caplog.text
 
-def test_merge_cartesian_freeze_bb_mix():
+def test_merge_cartesian_freeze_bb_mix(ke07_stru):
     """test a bb freeze case"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
     test_cons_list = [
-        stru_cons.create_backbone_freeze(test_stru),
-        stru_cons.CartesianFreeze(atoms=test_stru.atoms[5:12]),]
+        stru_cons.create_backbone_freeze(ke07_stru),
+        stru_cons.CartesianFreeze(atoms=ke07_stru.atoms[5:12]),]
     merged_cons = stru_cons.merge_cartesian_freeze(test_cons_list)
     assert merged_cons.constraint_type != "backbone_freeze"
 
-def test_merge_cartesian_freeze_bb_only():
+def test_merge_cartesian_freeze_bb_only(ke07_stru):
     """test a bb freeze case"""
-    test_pdb = f"{DATA_DIR}KE_07_R7_2_S.pdb"
-    test_stru = sp.get_structure(test_pdb)
     test_cons_list = [
-        stru_cons.create_backbone_freeze(stru=test_stru),]
+        stru_cons.create_backbone_freeze(stru=ke07_stru),]
     merged_cons = stru_cons.merge_cartesian_freeze(test_cons_list)
     assert merged_cons is test_cons_list[0]
@@ -0,0 +1,22 @@
+"""Shared fixtures for testing the enzy_htp.structure.structure_io submodule.
+Author: QZ Shao <shaoqz@icloud.com>
+Date: 2022-10-21
+"""
+import os
+import pytest
+from biopandas.pdb import PandasPdb
+
+
+@pytest.fixture(scope="session")
+def pdb_cache():
+    """a PandasPdb().read_pdb() that reads each PDB file only once per session.
+    The returned PandasPdb() is shared. Copy its .df before editing them in place."""
+    cache = {}
+
+    def read_pdb(pdb_path: str) -> PandasPdb:
+        pdb_path = os.path.abspath(pdb_path)
+        if pdb_path not in cache:
+            cache[pdb_path] = PandasPdb().read_pdb(pdb_path)
+        return cache[pdb_path]
+
+    return read_pdb
@@ -40,6 +40,12 @@ WORK_DIR = f'{CURRDIR}/../work_dir/'
 sp = PDBParser()
 
 
+def get_ter_df(pdb: PandasPdb) -> pd.DataFrame:
+    """the TER records of {pdb}. (a plain numpy comparison instead of .query() parsing an expression each time)"""
+    others_df = pdb.df['OTHERS']
+    return others_df.loc[others_df['record_name'].values == 'TER']
+
+
 def equiv_files(fname1: str, fname2: str, width: int = None) -> bool:
     """Helper method to check if two files are exactly equivalent."""
     for l1, l2 in zip(fs.lines_from_file(fname1), fs.lines_from_file(fname2)):
@@ -103,24 +109,90 @@ def test_check_valid_pdb_bad_input():
     assert not os.path.exists(non_ascii_pdb)
 
 
-def test_get_target_model():
+@pytest.mark.parametrize("pdb_name", ["3EZB_nmr.pdb", "1Q4T_ligand_test.pdb", "3NIR_alt_loc_test.pdb", "four_chain_no_id_ANISOU.pdb"])
+def test_read_pdb_df(pdb_cache, pdb_name):
+    """test _read_pdb_df gives the same dataframes as PandasPdb"""
+    pdb_file = f"{DATA_DIR}{pdb_name}"
+    answer_df = pdb_cache(pdb_file).df
+    test_df = sp._read_pdb_df(pdb_file)
+    assert set(test_df) == set(answer_df)
+    for record, record_df in answer_df.items():
+        pd.testing.assert_frame_equal(test_df[record], record_df)
+
+
+
+def test_read_pdb_df_cache():
+    """test _read_pdb_df returns independent copies and re-parses a changed file"""
+    test_pdb = f"{WORK_DIR}read_pdb_df_cache_test.pdb"
+    fs.safe_rm(test_pdb)
+    fs.write_lines(test_pdb, [
+        "ATOM      1  N   ALA A   1      11.104   6.134  -6.504  1.00  0.00           N",
+        "END",
+    ])
+    test_df_1 = sp._read_pdb_df(test_pdb)
+    test_df_1["ATOM"].loc[0, "atom_name"] = "X"
+    test_df_2 = sp._read_pdb_df(test_pdb)
+    assert test_df_2["ATOM"].loc[0, "atom_name"] == "N"
+
+    fs.write_lines(test_pdb, [
+        "ATOM      1  N   ALA A   1      11.104   6.134  -6.504  1.00  0.00           N",
+        "ATOM      2  CA  ALA A   1      11.639   6.071  -5.147  1.00  0.00           C",
+        "END",
+    ])
+    assert len(sp._read_pdb_df(test_pdb)["ATOM"]) == 2
+    fs.safe_rm(test_pdb)
+
+
+def test_read_pdb_df_cache_same_size_and_mtime():
+    """test _read_pdb_df re-parses a file rewritten in place with the same size and mtime"""
+    test_pdb = f"{WORK_DIR}read_pdb_df_cache_same_stat_test.pdb"
+    fs.safe_rm(test_pdb)
+    fs.write_lines(test_pdb, [
+        "ATOM      1  N   ALA A   1      11.104   6.134  -6.504  1.00  0.00           N",
+        "END",
+    ])
+    old_stat = os.stat(test_pdb)
+    assert sp._read_pdb_df(test_pdb)["ATOM"].loc[0, "x_coord"] == 11.104
+
+    fs.safe_rm(test_pdb)
+    fs.write_lines(test_pdb, [
+        "ATOM      1  N   ALA A   1      22.208   6.134  -6.504  1.00  0.00           N",
+        "END",
+    ])
+    os.utime(test_pdb, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+    new_stat = os.stat(test_pdb)
+    assert (new_stat.st_size, new_stat.st_mtime_ns) == (old_stat.st_size, old_stat.st_mtime_ns)
+    assert sp._read_pdb_df(test_pdb)["ATOM"].loc[0, "x_coord"] == 22.208
+    fs.safe_rm(test_pdb)
+
+
+def test_read_pdb_df_records(pdb_cache):
+    """test _read_pdb_df only gives the requested records and OTHERS rows"""
+    pdb_file = f"{DATA_DIR}3EZB_nmr.pdb"
+    answer_df = pdb_cache(pdb_file).df
+    test_df = sp._read_pdb_df(pdb_file, records=("ATOM", "OTHERS"), other_record_names=("TER", "MODEL", "ENDMDL"))
+    assert set(test_df) == {"ATOM", "OTHERS"}
+    pd.testing.assert_frame_equal(test_df["ATOM"], answer_df["ATOM"])
+    answer_others = answer_df["OTHERS"]
+    pd.testing.assert_frame_equal(test_df["OTHERS"],
+                                  answer_others[answer_others["record_name"].isin(("TER", "MODEL", "ENDMDL"))])
+
+
+def test_get_target_model(pdb_cache):
     '''
     test if _get_target_model is getting the correct model
     '''
     pdb_file = f'{DATA_DIR}/3EZB_nmr.pdb'
     # answer 0
     mdl_0_answer = f'{DATA_DIR}3EZB_nmr_mdl_0.pdb'
-    answer_0_pdb = PandasPdb()
-    answer_0_pdb.read_pdb(mdl_0_answer)
+    answer_0_pdb = pdb_cache(mdl_0_answer)
     mdl_0_answer_atom = list(answer_0_pdb.df['ATOM']['atom_number'])
     # answer 1
     mdl_1_answer = f'{DATA_DIR}3EZB_nmr_mdl_1.pdb'
-    answer_1_pdb = PandasPdb()
-    answer_1_pdb.read_pdb(mdl_1_answer)
+    answer_1_pdb = pdb_cache(mdl_1_answer)
     mdl_1_answer_atom = list(answer_1_pdb.df['ATOM']['atom_number'])
 
-    test_pdb = PandasPdb()
-    test_pdb.read_pdb(pdb_file)
+    test_pdb = pdb_cache(pdb_file)
     target_model_df, target_model_ter_df = sp._get_target_model(test_pdb.df, model=0)
     assert len(target_model_ter_df['record_name']) == 2
     assert list(target_model_df['atom_number']) == mdl_0_answer_atom
@@ -130,16 +202,14 @@ def test_get_target_model():
     assert list(target_model_df['atom_number']) == mdl_1_answer_atom
 
 
-def test_resolve_missing_chain_id_complete_missing():
+def test_resolve_missing_chain_id_complete_missing(pdb_cache):
     test_mdl = f'{DATA_DIR}3EZB_nmr_no_chain_id.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = test_mdl_pdb.df['ATOM']
-    target_ter_df = test_mdl_pdb.df['OTHERS'].query('record_name == "TER"')
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = test_mdl_pdb.df['ATOM'].copy()
+    target_ter_df = get_ter_df(test_mdl_pdb)
     # answer
     answer_mdl = f'{DATA_DIR}3EZB_nmr_no_chain_id_answer.pdb'
-    answer_mdl_pdb = PandasPdb()
-    answer_mdl_pdb.read_pdb(answer_mdl)
+    answer_mdl_pdb = pdb_cache(answer_mdl)
     answer_df_chain_ids = list(answer_mdl_pdb.df['ATOM']['chain_id'])
 
     sp._resolve_missing_chain_id(target_df, target_ter_df)
@@ -147,16 +217,14 @@ def test_resolve_missing_chain_id_complete_missing():
     assert list(target_df['chain_id']) == answer_df_chain_ids
 
 
-def test_resolve_missing_chain_id_partial_missing():
+def test_resolve_missing_chain_id_partial_missing(pdb_cache):
     test_mdl = f'{DATA_DIR}3EZB_nmr_no_chain_id_part.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = test_mdl_pdb.df['ATOM']
-    target_ter_df = test_mdl_pdb.df['OTHERS'].query('record_name == "TER"')
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = test_mdl_pdb.df['ATOM'].copy()
+    target_ter_df = get_ter_df(test_mdl_pdb)
     # answer
     answer_mdl = f'{DATA_DIR}3EZB_nmr_no_chain_id_answer.pdb'
-    answer_mdl_pdb = PandasPdb()
-    answer_mdl_pdb.read_pdb(answer_mdl)
+    answer_mdl_pdb = pdb_cache(answer_mdl)
     answer_df_chain_ids = list(answer_mdl_pdb.df['ATOM']['chain_id'])
 
     sp._resolve_missing_chain_id(target_df, target_ter_df)
@@ -164,16 +232,14 @@ def test_resolve_missing_chain_id_partial_missing():
     assert list(target_df['chain_id']) == answer_df_chain_ids
 
 
-def test_resolve_missing_chain_id_partial_atom_missing():
+def test_resolve_missing_chain_id_partial_atom_missing(pdb_cache):
     test_mdl = f'{DATA_DIR}3EZB_nmr_no_chain_id_part_atom.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = test_mdl_pdb.df['ATOM']
-    target_ter_df = test_mdl_pdb.df['OTHERS'].query('record_name == "TER"')
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = test_mdl_pdb.df['ATOM'].copy()
+    target_ter_df = get_ter_df(test_mdl_pdb)
     # answer
     answer_mdl = f'{DATA_DIR}3EZB_nmr_no_chain_id_answer.pdb'
-    answer_mdl_pdb = PandasPdb()
-    answer_mdl_pdb.read_pdb(answer_mdl)
+    answer_mdl_pdb = pdb_cache(answer_mdl)
     answer_df_chain_ids = list(answer_mdl_pdb.df['ATOM']['chain_id'])
 
     sp._resolve_missing_chain_id(target_df, target_ter_df)
@@ -181,19 +247,17 @@ def test_resolve_missing_chain_id_partial_atom_missing():
     assert list(target_df['chain_id']) == answer_df_chain_ids
 
 
-def test_resolve_missing_chain_id_redundant_ter():
+def test_resolve_missing_chain_id_redundant_ter(pdb_cache):
     '''
     in this case there are one redundant ter
     '''
     test_mdl = f'{DATA_DIR}3EZB_nmr_no_chain_id_red_ter.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = test_mdl_pdb.df['ATOM']
-    target_ter_df = test_mdl_pdb.df['OTHERS'].query('record_name == "TER"')
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = test_mdl_pdb.df['ATOM'].copy()
+    target_ter_df = get_ter_df(test_mdl_pdb)
     # answer
     answer_mdl = f'{DATA_DIR}3EZB_nmr_no_chain_id_answer.pdb'
-    answer_mdl_pdb = PandasPdb()
-    answer_mdl_pdb.read_pdb(answer_mdl)
+    answer_mdl_pdb = pdb_cache(answer_mdl)
     answer_df_chain_ids = list(answer_mdl_pdb.df['ATOM']['chain_id'])
 
     sp._resolve_missing_chain_id(target_df, target_ter_df)
@@ -201,15 +265,14 @@ def test_resolve_missing_chain_id_redundant_ter():
     assert list(target_df['chain_id']) == answer_df_chain_ids
 
 
-def test_resolve_missing_chain_id_wANISOU():
+def test_resolve_missing_chain_id_wANISOU(pdb_cache):
     '''
     in this case there are one redundant ter
     '''
     test_mdl = f'{DATA_DIR}four_chain_no_id_ANISOU.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = test_mdl_pdb.df['ATOM']
-    target_ter_df = test_mdl_pdb.df['OTHERS'].query('record_name == "TER"')
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = test_mdl_pdb.df['ATOM'].copy()
+    target_ter_df = get_ter_df(test_mdl_pdb)
 
     sp._resolve_missing_chain_id(target_df, target_ter_df)
 
@@ -219,52 +282,30 @@ def test_resolve_missing_chain_id_wANISOU():
     ]
 
 
-def test_resolve_missing_chain_id_simple():
+@pytest.mark.parametrize("fname,expected", [
+    ("two_chain.pdb", {'A': 12, 'B': 30}),
+    ("three_chain.pdb", {'A': 12, 'B': 15, 'C': 14}),
+    ("four_chain.pdb", {'A': 12, 'B': 15, 'C': 7, 'D': 6}),
+])
+def test_resolve_missing_chain_id_simple(pdb_cache, fname, expected):
     '''Ensuring that the _resolve_missing_chain_id() correctly names new chains.'''
+    input_pdb = pdb_cache(f'{DATA_DIR}/{fname}')
+    target_model_df, target_model_ter_df = sp._get_target_model(input_pdb.df, 0)
+    sp._resolve_missing_chain_id(target_model_df, target_model_ter_df)
+
+    assert target_model_df['chain_id'].value_counts().to_dict() == expected
 
-    def get_chains(fname) -> Dict[str, Chain]:
-        '''Helper testing method to get the chains from a PDB file.'''
-        input_pdb = PandasPdb()
-        input_pdb.read_pdb(fname)
-        target_model_df, target_model_ter_df = sp._get_target_model(input_pdb.df, 0)
-        return target_model_df, target_model_ter_df
-
-    two_chain = f'{DATA_DIR}/two_chain.pdb'
-    three_chain = f'{DATA_DIR}/three_chain.pdb'
-    four_chain = f'{DATA_DIR}/four_chain.pdb'
-    two_df, two_ter_df = get_chains(two_chain)
-    three_df, three_ter_df = get_chains(three_chain)
-    four_df, four_ter_df = get_chains(four_chain)
-    sp._resolve_missing_chain_id(two_df, two_ter_df)
-    sp._resolve_missing_chain_id(three_df, three_ter_df)
-    sp._resolve_missing_chain_id(four_df, four_ter_df)
-
-    assert set(two_df['chain_id'].values) == {'A', 'B'}
-    assert len(two_df[two_df['chain_id'] == 'A']) == 12
-    assert len(two_df[two_df['chain_id'] == 'B']) == 30
-    assert set(three_df['chain_id'].values) == {'A', 'B', 'C'}
-    assert len(three_df[three_df['chain_id'] == 'A']) == 12
-    assert len(three_df[three_df['chain_id'] == 'B']) == 15
-    assert len(three_df[three_df['chain_id'] == 'C']) == 14
-    assert set(four_df['chain_id'].values) == {'A', 'B', 'C', 'D'}
-    assert len(four_df[four_df['chain_id'] == 'A']) == 12
-    assert len(four_df[four_df['chain_id'] == 'B']) == 15
-    assert len(four_df[four_df['chain_id'] == 'C']) == 7
-    assert len(four_df[four_df['chain_id'] == 'D']) == 6
-
-
-def test_resolve_missing_chain_id_repeat_with_multi_in_HET():
+
+def test_resolve_missing_chain_id_repeat_with_multi_in_HET(pdb_cache):
     """test the case when there are repeating chain id in HET chains & multiple chain id in HET chains"""
     test_mdl = f'{DATA_DIR}1Q4T_atom_res_ch_build_test.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = pd.concat((test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM']), ignore_index=True)
-    target_ter_df = test_mdl_pdb.df['OTHERS'].query('record_name == "TER"')
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = sp._get_atom_site_df(test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM'])
+    target_ter_df = get_ter_df(test_mdl_pdb)
     # answer
     answer_mdl = f'{DATA_DIR}1Q4T_test_update_chain_id_answer.pdb'
-    answer_mdl_pdb = PandasPdb()
-    answer_mdl_pdb.read_pdb(answer_mdl)
-    answer_df_chain_ids = list(pd.concat((answer_mdl_pdb.df['ATOM'], answer_mdl_pdb.df['HETATM']), ignore_index=True)['chain_id'])
+    answer_mdl_pdb = pdb_cache(answer_mdl)
+    answer_df_chain_ids = list(sp._get_atom_site_df(answer_mdl_pdb.df['ATOM'], answer_mdl_pdb.df['HETATM'])['chain_id'])
 
     idx_change_mapper = sp._resolve_missing_chain_id(target_df, target_ter_df)
     assert idx_change_mapper == {
@@ -291,13 +332,12 @@ def test_resolve_missing_chain_id_repeat_with_multi_in_HET():
     assert list(target_df['chain_id']) == answer_df_chain_ids
 
 
-def test_resolve_missing_chain_id_missing_with_multi_chainid():
+def test_resolve_missing_chain_id_missing_with_multi_chainid(pdb_cache):
     """test the case when there are missing chain id and multi chain id in the same chain"""
     test_mdl = f'{DATA_DIR}1Q4T_missing_in_het_chain.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = pd.concat((test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM']), ignore_index=True)
-    target_ter_df = test_mdl_pdb.df['OTHERS'].query('record_name == "TER"')
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = sp._get_atom_site_df(test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM'])
+    target_ter_df = get_ter_df(test_mdl_pdb)
 
     with pytest.raises(SystemExit) as exe:
         sp._resolve_missing_chain_id(target_df, target_ter_df)
@@ -306,13 +346,12 @@ def test_resolve_missing_chain_id_missing_with_multi_chainid():
     assert exe.value.code == 1
 
 
-def test_resolve_missing_chain_id_with_same_chainid_in_2_ATOM():
+def test_resolve_missing_chain_id_with_same_chainid_in_2_ATOM(pdb_cache):
     """test the case when there are same chain id in 2 ATOM chains"""
     test_mdl = f'{DATA_DIR}two_chain_same_id.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = pd.concat((test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM']), ignore_index=True)
-    target_ter_df = test_mdl_pdb.df['OTHERS'].query('record_name == "TER"')
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = sp._get_atom_site_df(test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM'])
+    target_ter_df = get_ter_df(test_mdl_pdb)
 
     with pytest.raises(SystemExit) as exe:
         sp._resolve_missing_chain_id(target_df, target_ter_df)
@@ -321,18 +360,16 @@ def test_resolve_missing_chain_id_with_same_chainid_in_2_ATOM():
     assert exe.value.code == 1
 
 
-def test_resolve_missing_chain_id_repeat():
+def test_resolve_missing_chain_id_repeat(pdb_cache):
     """test the case when there are repeating chain id in HET chains"""
     test_mdl = f'{DATA_DIR}1Q4T_no_missing_repeat_het_chain_id.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = pd.concat((test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM']), ignore_index=True)
-    target_ter_df = test_mdl_pdb.df['OTHERS'].query('record_name == "TER"')
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = sp._get_atom_site_df(test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM'])
+    target_ter_df = get_ter_df(test_mdl_pdb)
     # answer
     answer_mdl = f'{DATA_DIR}1Q4T_no_missing_repeat_het_chain_id_answer.pdb'
-    answer_mdl_pdb = PandasPdb()
-    answer_mdl_pdb.read_pdb(answer_mdl)
-    answer_df_chain_ids = list(pd.concat((answer_mdl_pdb.df['ATOM'], answer_mdl_pdb.df['HETATM']), ignore_index=True)['chain_id'])
+    answer_mdl_pdb = pdb_cache(answer_mdl)
+    answer_df_chain_ids = list(sp._get_atom_site_df(answer_mdl_pdb.df['ATOM'], answer_mdl_pdb.df['HETATM'])['chain_id'])
 
     sp._resolve_missing_chain_id(target_df, target_ter_df)
     assert list(target_df['chain_id']) == answer_df_chain_ids
@@ -347,59 +384,91 @@ def test_get_legal_pdb_chain_ids():
     ALL_NAMES.remove('A')
     result3 = sp._get_legal_pdb_chain_ids(['A'])
     assert set(result3) == set(ALL_NAMES)
+    assert result3[-1] == 'B'
+    assert result3[0] == '49999'
+
+
+def test_iter_legal_pdb_chain_ids():
+    """test the lazy version yields names in the .pop() order of _get_legal_pdb_chain_ids"""
+    result = sp._iter_legal_pdb_chain_ids(['A', 'C', '0'])
+    answer = sp._get_legal_pdb_chain_ids(['A', 'C', '0'])
+    for _ in range(30):
+        assert next(result) == answer.pop()
 
 
-def test_resolve_alt_loc_first():
+def test_get_atom_site_df(pdb_cache):
+    """test combining ATOM and HETATM records with and without an empty part"""
+    input_pdb = pdb_cache(f'{DATA_DIR}1Q4T_ligand_test.pdb')
+    atom_df, hetatm_df = input_pdb.df['ATOM'], input_pdb.df['HETATM']
+    result = sp._get_atom_site_df(atom_df, hetatm_df)
+    assert result.equals(pd.concat((atom_df, hetatm_df), ignore_index=True))
+
+    result = sp._get_atom_site_df(atom_df, hetatm_df.iloc[0:0])
+    assert result.equals(atom_df.reset_index(drop=True))
+    assert result is not atom_df
+    result.loc[0, 'chain_id'] = 'X'
+    assert atom_df.loc[0, 'chain_id'] != 'X'
+    result = sp._get_atom_site_df(atom_df.iloc[0:0], hetatm_df)
+    assert list(result.index) == list(range(len(hetatm_df)))
+
+
+def test_resolve_alt_loc_first(pdb_cache):
     '''test resolve alt loc recored demoed in 3NIR'''
     test_mdl = f'{DATA_DIR}3NIR_alt_loc_test.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = pd.concat((test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM']), ignore_index=True)
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = sp._get_atom_site_df(test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM'])
     print(target_df)
     # answer
     answer_mdl = f'{DATA_DIR}3NIR_alt_loc_answer_A.pdb'
-    answer_mdl_pdb = PandasPdb()
-    answer_mdl_pdb.read_pdb(answer_mdl)
-    answer_df = pd.concat((answer_mdl_pdb.df['ATOM'], answer_mdl_pdb.df['HETATM']), ignore_index=True)
+    answer_mdl_pdb = pdb_cache(answer_mdl)
+    answer_df = sp._get_atom_site_df(answer_mdl_pdb.df['ATOM'], answer_mdl_pdb.df['HETATM'])
 
     sp._resolve_alt_loc(target_df)
 
     assert list(target_df['atom_number']) == list(answer_df['atom_number'])
 
 
-def test_resolve_alt_loc_keep_B():
+def test_resolve_alt_loc_keep_B(pdb_cache):
     '''test resolve alt loc recored demoed in 3NIR'''
     test_mdl = f'{DATA_DIR}3NIR_alt_loc_test.pdb'
-    test_mdl_pdb = PandasPdb()
-    test_mdl_pdb.read_pdb(test_mdl)
-    target_df = pd.concat((test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM']), ignore_index=True)
+    test_mdl_pdb = pdb_cache(test_mdl)
+    target_df = sp._get_atom_site_df(test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM'])
     print(target_df)
     # answer
     answer_mdl = f'{DATA_DIR}3NIR_alt_loc_answer_B.pdb'
-    answer_mdl_pdb = PandasPdb()
-    answer_mdl_pdb.read_pdb(answer_mdl)
-    answer_df = pd.concat((answer_mdl_pdb.df['ATOM'], answer_mdl_pdb.df['HETATM']), ignore_index=True)
+    answer_mdl_pdb = pdb_cache(answer_mdl)
+    answer_df = sp._get_atom_site_df(answer_mdl_pdb.df['ATOM'], answer_mdl_pdb.df['HETATM'])
 
     sp._resolve_alt_loc(target_df, keep='B')
 
     assert list(target_df['atom_number']) == list(answer_df['atom_number'])
 
 
-def test_build_atom():
+def test_resolve_alt_loc_no_alt_loc(pdb_cache):
+    """test resolving a df without any alt loc record leaves it untouched"""
+    test_mdl_pdb = pdb_cache(f'{DATA_DIR}12E8_small_four_chain.pdb')
+    target_df = sp._get_atom_site_df(test_mdl_pdb.df['ATOM'], test_mdl_pdb.df['HETATM'])
+    answer_df = target_df.copy()
+
+    sp._resolve_alt_loc(target_df)
+
+    assert target_df.equals(answer_df)
+
+
+def test_build_atom(pdb_cache):
     '''
     a weak teat of _build_atom that insure no missing residue
     '''
     pdb_file_path = f'{DATA_DIR}1Q4T_test_update_chain_id_answer.pdb'
-    input_pdb = PandasPdb()
-    input_pdb.read_pdb(pdb_file_path)
-    target_df = pd.concat((input_pdb.df['ATOM'], input_pdb.df['HETATM']), ignore_index=True)
+    input_pdb = pdb_cache(pdb_file_path)
+    target_df = sp._get_atom_site_df(input_pdb.df['ATOM'], input_pdb.df['HETATM'])
 
     atom_mapper: Dict[tuple, Atom] = sp._build_atoms(target_df)
     df_residue = target_df.groupby(['residue_number', 'chain_id'])
     assert len(atom_mapper) == len(df_residue)
 
 
-def test_build_residue():
+def test_build_residue(pdb_cache):
     '''
     a weak teat of _build_atom that insure no missing residue
     just make sure the number of chains and the idx_change_mapper is correct
@@ -407,9 +476,8 @@ def test_build_residue():
     also test for _categorize_residue ligand case
     '''
     pdb_file_path = f'{DATA_DIR}1Q4T_test_update_chain_id_answer.pdb'
-    input_pdb = PandasPdb()
-    input_pdb.read_pdb(pdb_file_path)
-    target_df = pd.concat((input_pdb.df['ATOM'], input_pdb.df['HETATM']), ignore_index=True)
+    input_pdb = pdb_cache(pdb_file_path)
+    target_df = sp._get_atom_site_df(input_pdb.df['ATOM'], input_pdb.df['HETATM'])
     atom_mapper: Dict[tuple, Atom] = sp._build_atoms(target_df)
     # print(*list(atom_mapper.keys()), sep='\n')
 
@@ -423,25 +491,21 @@ def test_build_residue():
     assert filter(lambda x: (x.residue.idx, x.residue.name) == (sample.idx, sample.name), sample.atoms)
 
 
-def test_categorize_residue_canonical():
+def test_categorize_residue_canonical(pdb_cache):
     pdb_file_path = f'{DATA_DIR}/two_chain.pdb'
-    input_pdb = PandasPdb()
-    input_pdb.read_pdb(pdb_file_path)
-    target_df = input_pdb.df['ATOM']
+    input_pdb = pdb_cache(pdb_file_path)
+    target_df = input_pdb.df['ATOM'].copy()
     atom_mapper = sp._build_atoms(target_df)
-    res_mapper = defaultdict(list)
-    for res_key, atoms in atom_mapper.items():
-        res_mapper[res_key[0]].append(Residue(int(res_key[1]), res_key[2], atoms))
+    res_mapper = sp._group_residues_by_chain(atom_mapper)
 
     sp._categorize_pdb_residue(res_mapper)
     all_residue = list(itertools.chain.from_iterable(res_mapper.values()))
     assert len(list(filter(lambda x: x.rtype is not chem.ResidueType.CANONICAL, all_residue))) == 0
 
 
-def test_categorize_residue_metal():
+def test_categorize_residue_metal(pdb_cache):
     pdb_file_path = f'{DATA_DIR}/just_metal.pdb'
-    input_pdb = PandasPdb()
-    input_pdb.read_pdb(pdb_file_path)
+    input_pdb = pdb_cache(pdb_file_path)
     row = input_pdb.df['HETATM'].iloc[0]
     zn_atom = Atom.from_biopandas(row)
     res_mapper = defaultdict(list)
@@ -453,16 +517,13 @@ def test_categorize_residue_metal():
     assert all_residue[0].rtype is chem.ResidueType.METAL
 
 
-def test_categorize_residue_modified():
+def test_categorize_residue_modified(pdb_cache):
     """make a clean df manually and build atoms upon that. test if categorize_residue works for modified"""
     pdb_file_path = f'{DATA_DIR}/5JT3_noncanonical_test.pdb'
-    input_pdb = PandasPdb()
-    input_pdb.read_pdb(pdb_file_path)
-    target_df = pd.concat((input_pdb.df['ATOM'], input_pdb.df['HETATM']), ignore_index=True)
+    input_pdb = pdb_cache(pdb_file_path)
+    target_df = sp._get_atom_site_df(input_pdb.df['ATOM'], input_pdb.df['HETATM'])
     atom_mapper = sp._build_atoms(target_df)
-    res_mapper = defaultdict(list)
-    for res_key, atoms in atom_mapper.items():
-        res_mapper[res_key[0]].append(Residue(int(res_key[1]), res_key[2], atoms))
+    res_mapper = sp._group_residues_by_chain(atom_mapper)
 
     sp._categorize_pdb_residue(res_mapper)
     all_residue = list(itertools.chain.from_iterable(res_mapper.values()))
@@ -490,6 +551,14 @@ def test_get_structure_bad_input():
     assert exe.type == SystemExit
     assert exe.value.code == 1
 
+    non_ascii_pdb = f'{WORK_DIR}bad_pdb.pdb'
+    fs.write_lines(non_ascii_pdb, ['ATOM      1  N   ALA A   1      11.104   6.134  -6.504  1.00  0.00           N', '日本人 中國的'])
+    with pytest.raises(SystemExit) as exe:
+        sp.get_structure(non_ascii_pdb)
+
+    assert exe.value.code == 1
+    fs.safe_rm(non_ascii_pdb)
+
 
 @pytest.mark.interface
 def test_get_structure_simple():
@@ -17,6 +17,11 @@ def test_prepin_parser_get_stru():
     test_stru = PrepinParser().get_structure(test_prepin)
     assert test_stru.residues[0]
 
+def test_get_residue_name():
+    """make sure the header-only read gives the same name as the full parse"""
+    test_prepin = f"{DATA_DIR}/ligand_H5J.prepin"
+    assert PrepinParser().get_residue_name(test_prepin) == PrepinParser().get_structure(test_prepin).residues[0].name
+
 def test_deduce_coord_end():
     """test using an example file"""
     test_prepin = f"{DATA_DIR}/ligand_H5J.prepin"
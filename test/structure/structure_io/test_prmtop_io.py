@@ -3,6 +3,7 @@
 Author: QZ Shao <shaoqz@icloud.com>
 Date: 2024-01-23
 """
+import os
 from pathlib import Path
 
 import pytest
@@ -142,6 +143,43 @@ def test_parse_prmtop_file():
     # assert len(data['IROTAT']) == n_atoms
     # assert len(data['RADII']) == n_atoms
 
+def test_parse_prmtop_file_cached():
+    """test re-parsing an unchanged file hits the cache and returns an independent copy"""
+    test_prmtop = f"{DATA_DIR}/prmtop_1"
+    data_1 = PrmtopParser._parse_prmtop_file(test_prmtop)
+    hits = PrmtopParser._prmtop_data_cache.hits
+    data_2 = PrmtopParser._parse_prmtop_file(test_prmtop)
+
+    assert PrmtopParser._prmtop_data_cache.hits == hits + 1
+    assert data_1 == data_2
+    data_1["ATOM_NAME"].clear()
+    assert len(PrmtopParser._parse_prmtop_file(test_prmtop)["ATOM_NAME"]) == 23231
+
+def test_parse_prmtop_file_cached_same_size_and_mtime(tmp_path):
+    """test a prmtop rewritten in place with the same size and mtime is re-parsed"""
+    test_prmtop = tmp_path / "prmtop_1"
+    content = Path(f"{DATA_DIR}/prmtop_1").read_bytes()
+    test_prmtop.write_bytes(content)
+    old_stat = os.stat(test_prmtop)
+    assert PrmtopParser._parse_prmtop_file(str(test_prmtop))["TITLE"] == "default_name"
+
+    test_prmtop.write_bytes(content.replace(b"default_name", b"changed_name"))
+    os.utime(test_prmtop, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+    new_stat = os.stat(test_prmtop)
+    assert (new_stat.st_size, new_stat.st_mtime_ns) == (old_stat.st_size, old_stat.st_mtime_ns)
+    assert PrmtopParser._parse_prmtop_file(str(test_prmtop))["TITLE"] == "changed_name"
+
+def test_parse_prmtop_file_cached_subclass():
+    """test a subclass overriding a section parser does not get the base class result from the cache"""
+    class TitlePrmtopParser(PrmtopParser):
+        @classmethod
+        def _parse_title(cls, content: str):
+            return {"TITLE": "overridden"}
+
+    test_prmtop = f"{DATA_DIR}/prmtop_1"
+    assert PrmtopParser._parse_prmtop_file(test_prmtop)["TITLE"] == "default_name"
+    assert TitlePrmtopParser._parse_prmtop_file(test_prmtop)["TITLE"] == "overridden"
+
 def test_parse_prmtop_no_file():
     """Checking that PrmtopParser._parse_prmtop_file() throws an error if the listed file does not exist."""
 
@@ -19,25 +19,25 @@ DATA_DIR = f"{CURR_DIR}/../data/"
 WORK_DIR = f"{CURR_DIR}/../work_dir/"
 sp = PDBParser()
 
-def test_is_whole_residue_only():
+def test_is_whole_residue_only(ke07_stru):
     """as name"""
-    test_stru = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S.pdb")
+    test_stru = ke07_stru
     sele = stru_sele.select_stru(
         test_stru, "br. (resi 254 around 5)")
     test_raw_region = stru_regi.StructureRegion(atoms=sele.atoms)
     assert test_raw_region.is_whole_residue_only()
 
-def test_is_whole_residue_only_false():
+def test_is_whole_residue_only_false(ke07_stru):
     """as name"""
-    test_stru = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S.pdb")
+    test_stru = ke07_stru
     sele = stru_sele.select_stru(
         test_stru, "resi 254 around 5")
     test_raw_region = stru_regi.StructureRegion(atoms=sele.atoms)
     assert not test_raw_region.is_whole_residue_only()
 
-def test_involved_residues_with_free_terminal():
+def test_involved_residues_with_free_terminal(ke07_stru):
     """as name"""
-    test_stru = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S.pdb")
+    test_stru = ke07_stru
     sele = stru_sele.select_stru(
         test_stru, "resi 2+3+4")
     test_raw_region = stru_regi.StructureRegion(atoms=sele.atoms)
@@ -45,10 +45,10 @@ def test_involved_residues_with_free_terminal():
     assert result["c_ter"] == [test_stru.get("A.4")]
     assert result["n_ter"] == [test_stru.get("A.2")]
 
-def test_involved_residues_with_free_terminal_double():
+def test_involved_residues_with_free_terminal_double(ke07_stru):
     """test the case that contains residues that have both
     C and N ter exposed"""
-    test_stru = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S.pdb")
+    test_stru = ke07_stru
     sele = stru_sele.select_stru(
         test_stru, "resi 2+5+7")
     test_raw_region = stru_regi.StructureRegion(atoms=sele.atoms)
@@ -62,9 +62,9 @@ def test_involved_residues_with_free_terminal_double():
     assert set(result["c_ter"]) == answer
     assert set(result["n_ter"]) == answer
 
-def test_involved_residues_with_free_terminal_ter():
+def test_involved_residues_with_free_terminal_ter(ke07_stru):
     """test the case using chain terminal residues"""
-    test_stru = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S.pdb")
+    test_stru = ke07_stru
     sele = stru_sele.select_stru(
         test_stru, "resi 1+253")
     test_raw_region = stru_regi.StructureRegion(atoms=sele.atoms)
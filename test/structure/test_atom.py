@@ -8,7 +8,6 @@ import logging
 import os
 import enzy_htp
 import numpy as np
-import pandas as pd
 from typing import List
 from copy import deepcopy
 import pytest
@@ -62,6 +61,30 @@ def test_no_optional_data():
     assert atom.charge is None
 
 
+def test_from_biopandas_df():
+    """test building Atom()s from a whole dataframe gives the same Atom()s as
+    from_biopandas() on each row"""
+    input_pdb = PandasPdb().read_pdb(f"{DATA_DIR}1Q4T_ligand_test.pdb")
+    df = PDBParser._get_atom_site_df(input_pdb.df["ATOM"], input_pdb.df["HETATM"])
+    df.loc[0, "element_symbol"] = ""
+    df.loc[1, "b_factor"] = np.nan
+    test_atoms = Atom.from_biopandas_df(df)
+    assert len(test_atoms) == len(df)
+    for test_atom, (_, row) in zip(test_atoms, df.iterrows()):
+        answer_atom = Atom.from_biopandas(row)
+        assert test_atom.name == answer_atom.name
+        assert test_atom.coord == answer_atom.coord
+        assert test_atom._idx == answer_atom._idx
+        assert test_atom._b_factor == answer_atom._b_factor
+        assert test_atom._element == answer_atom._element
+        assert test_atom._charge == answer_atom._charge
+        assert test_atom.parent is None
+    # repeated names and elements are interned
+    ca_atoms = [atom for atom in test_atoms if atom.name == "CA"]
+    assert all(atom.name is ca_atoms[0].name for atom in ca_atoms)
+    assert all(atom._element is ca_atoms[0]._element for atom in ca_atoms)
+
+
 def test_element_canonical():
     """test get atom element for C from 1NVG"""
     stru = PDBParser().get_structure(f"{DATA_DIR}1NVG.pdb")
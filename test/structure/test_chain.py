@@ -162,3 +162,12 @@ def test_has_metal():
     structure: Structure = sp.get_structure(pdb_file)
     assert not structure.chains[0].has_metal()
     assert structure.chains[1].has_metal()
+
+
+def test_chain_type():
+    """Checks Chain.chain_type for polypeptide and non-polypeptide chains."""
+    structure: Structure = sp.get_structure(f"{DATA_DIR}/1Q4T_ligand_test.pdb")
+    chain_types = {ch.name: ch.chain_type for ch in structure.chains}
+    assert chain_types["A"] == "polypeptide"
+    assert chain_types["C"] == "ligand,solvent"
+    assert Chain("X", []).is_polypeptide()
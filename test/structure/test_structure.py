@@ -144,6 +144,12 @@ def test_atoms():  # TODO(shaoqz) wait for test
     assert struct.atoms
 
 
+def test_num_atoms(ke07_stru):
+    """as name"""
+    assert ke07_stru.num_atoms == len(ke07_stru.atoms)
+    assert ke07_stru.num_atoms == sum(ch.num_atoms for ch in ke07_stru.chains)
+
+
 def test_deepcopy():
     """test the hehavior of copy.deepcopy on Structure()
     context"""
@@ -234,20 +240,27 @@ def test_residue_index_mapper(): # TODO
     stru: Structure = sp.get_structure(pdb_file_path)
     raise Exception("TODO")
 
-def test_is_same_topology():
+def test_is_same_topology(ke07_stru):
     """as name"""
     test_other = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S_geom_1.pdb")
-    test_self = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S.pdb")
+    test_self = ke07_stru
     assert test_self.is_same_topology(test_other)
 
-def test_hydrogens():
+def test_is_same_topology_false(ke07_stru):
+    """test the case that only 1 residue has a different atom composition"""
+    test_other = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S_geom_1.pdb")
+    test_self = ke07_stru
+    test_other.residues[-1].atoms[-1].delete_from_parent()
+    assert not test_self.is_same_topology(test_other)
+
+def test_hydrogens(ke07_stru):
     """as nam. result verified by pymol"""
-    test_stru = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S.pdb")
+    test_stru = ke07_stru
     assert len(test_stru.hydrogens()) == 2000
 
-def test_hydrogens_polypeptide_only():
+def test_hydrogens_polypeptide_only(ke07_stru):
     """as name"""
-    test_stru = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S.pdb")
+    test_stru = ke07_stru
     assert len(test_stru.hydrogens(polypeptide_only=True)) == 1996
 
 def test_net_chrgspin_mapper():
@@ -256,8 +269,67 @@ def test_net_chrgspin_mapper():
     test_stru.assign_ncaa_chargespin({"H5J" : (0,1)})
     assert test_stru.ncaa_chrgspin_mapper == {"H5J" : (0,1)}
 
-def test_amino_acids():
+def test_amino_acids(ke07_stru):
     """as name"""
-    test_stru = sp.get_structure(f"{DATA_DIR}KE_07_R7_2_S.pdb")
+    test_stru = ke07_stru
     
     assert len(test_stru.amino_acids) == 253
+
+def test_absolute_index():
+    """as name"""
+    test_stru = sp.get_structure(f"{DATA_DIR}1Q4T_ligand_test.pdb")
+    residues = test_stru.residues
+    for ridx in (0, 1, len(residues) // 2, len(residues) - 1):
+        assert test_stru.absolute_index(residues[ridx]) == ridx
+        assert test_stru.absolute_index(residues[ridx], indexed=1) == ridx + 1
+
+def test_absolute_index_not_found():
+    """test the case that the target residue is from a copied Structure"""
+    test_stru = sp.get_structure(f"{DATA_DIR}1Q4T_ligand_test.pdb")
+    copy_stru = deepcopy(test_stru)
+    with pytest.raises(SystemExit) as exe:
+        test_stru.absolute_index(copy_stru.residues[0])
+    assert exe.value.code == 1
+
+def test_sort_chains():
+    """as name"""
+    test_stru = Structure([Chain(name, []) for name in ["10", "B", "2", "Z", "A"]])
+    test_stru.sort_chains()
+    assert test_stru.chain_names == ["A", "B", "Z", "2", "10"]
+
+def test_str():
+    """as name"""
+    test_stru = sp.get_structure(f"{DATA_DIR}12E8_small_four_chain.pdb")
+    test_str = str(test_stru)
+    assert f"chains: (sorted, original {test_stru.chain_names})" in test_str
+    for ch in test_stru.chains:
+        assert f"    {ch.name}({ch.chain_type}): residue: {ch.residue_idx_interval()} atom_count: {ch.num_atoms}" in test_str
+
+def test_legal_new_chain_names():
+    """as name"""
+    test_stru = Structure([Chain(name, []) for name in ["A", "C", "0"]])
+    result = test_stru._legal_new_chain_names()
+    assert result[:3] == ["B", "D", "E"]
+    assert "0" not in result
+    assert result[-1] == "499"
+    assert len(result) == 26 + 500 - 3
+
+def test_find_atoms_in_range():
+    """as name. compare with a per-atom distance check"""
+    test_stru = sp.get_structure(f"{DATA_DIR}12E8_small_four_chain.pdb")
+    center = test_stru.atoms[10]
+    answer = [atom for atom in test_stru.atoms if np.linalg.norm(np.array(atom.coord) - np.array(center.coord)) <= 5.0]
+    result = test_stru.find_atoms_in_range(center, 5.0)
+    assert result == answer
+    assert center in result
+    assert test_stru.find_atoms_in_range(center.coord, 5.0) == answer
+
+def test_delitem():
+    """as name. test deleting chains by index and by name"""
+    test_stru = Structure([Chain(name, []) for name in ["A", "B", "C"]])
+    del test_stru[0]
+    assert test_stru.chain_names == ["B", "C"]
+    del test_stru["C"]
+    assert test_stru.chain_names == ["B"]
+    with pytest.raises(KeyError):
+        del test_stru[1.0]